@@ -5,19 +5,185 @@ This module handles API interactions with the Census TIGERweb services to fetch
 states and counties data, replacing the static GeoJSON files with dynamic API calls.
 """
 
-import json
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from typing import Dict, List, Optional, Any
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from threading import Lock
-import sys
 import os
+import pickle
+import sys
 
 # Import the query parameters
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from geometry_query_params.states_query import states_url, states_params
 from geometry_query_params.counties_query import counties_url, total_records_parms, counties_params
-from data.data_manager import REGIONS, REGION_COLORS
+from data.data_manager import REGIONS, REGION_COLORS, STATE_TO_REGION, INSET_STATES, parse_json
+
+# Compact geometry type codes for the per-state arrays (0 = anything else)
+GEOM_TYPE_CODES = {'Polygon': 1, 'MultiPolygon': 2}
+GEOM_TYPE_NAMES = {code: name for name, code in GEOM_TYPE_CODES.items()}
+
+# WGS84 semi-major axis (meters) used by Web Mercator
+EARTH_RADIUS = 6378137.0
+
+# Optional: shapely is used to simplify state outlines for hit-testing and highlights
+try:
+    from shapely.geometry import shape
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+
+# Optional: aiohttp keeps every per-state county request in flight on one event loop
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Optional: ijson parses the states response incrementally instead of all at once
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Douglas-Peucker tolerance (in degrees) for simplified state outlines
+STATE_SIMPLIFY_TOLERANCE = 0.01
+
+# Douglas-Peucker tolerance (in degrees) for the county outlines handed to the chloropleth map
+COUNTY_SIMPLIFY_TOLERANCE = 0.01
+
+# Concurrent county requests; the connection pool is sized to cover them
+COUNTY_FETCH_WORKERS = 8
+HTTP_POOL_SIZE = 16
+
+# Transient gateway errors from TIGERweb are retried with backoff before a fetch fails
+HTTP_RETRIES = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504),
+                     allowed_methods=frozenset({'GET', 'HEAD'}))
+
+# Parsed states are pickled here together with the ETag of the response they came from
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ess6510')
+
+# Seconds a states cache is used without asking the server whether the layer changed
+STATES_CACHE_TTL = 24 * 60 * 60
+
+# The ETag probe is sent without retries, so a slow server costs at most this long
+ETAG_PROBE_TIMEOUT = 3
+
+# Bump when the cached attributes change shape so stale pickles are ignored
+STATES_CACHE_VERSION = 4
+
+# Everything load_states_data produces, so a cache hit skips parsing and geometry prep
+STATES_CACHE_ATTRS = ('states_data', 'state_geoms', 'state_centroids', 'contiguous_features',
+                      'inset_features', 'state_simple_rings', 'state_names', 'state_geom_types',
+                      'state_point_counts')
+
+def fetch_features(url: str, params: Dict, timeout: float = 60, session: Optional[requests.Session] = None) -> Dict:
+    """
+    Run an ArcGIS REST query and decode the (gzip-compressed) JSON response
+    
+    Args:
+        url: Layer query endpoint
+        params: Query parameters, including 'f'
+        timeout: Request timeout in seconds
+        session: Optional requests.Session to reuse pooled connections
+        
+    Returns:
+        The decoded response; ArcGIS reports query errors under an 'error' key
+    """
+    response = (session or requests).get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+    return parse_json(response.content)
+
+def stream_features(url: str, params: Dict, timeout: float = 60, session: Optional[requests.Session] = None) -> Iterator[Dict]:
+    """
+    Run an ArcGIS REST query and yield its features one at a time with ijson
+    
+    Args:
+        url: Layer query endpoint
+        params: Query parameters, including 'f'
+        timeout: Request timeout in seconds
+        session: Optional requests.Session to reuse pooled connections
+        
+    Yields:
+        Esri JSON feature dictionaries, parsed straight off the socket
+    """
+    with (session or requests).get(url, params=params, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True  # Let urllib3 undo the gzip transfer encoding
+        yield from ijson.items(response.raw, 'features.item', use_float=True)
+
+class Feature:
+    """
+    GeoJSON feature emitted by APIDataManager
+    
+    Fields live in __slots__, so a feature carries no per-instance dict. Item
+    access mirrors the GeoJSON dict layout (feature['properties']['NAME']),
+    including the cached '_'-prefixed summaries, so dict-style callers keep working.
+    """
+    __slots__ = ('name', 'geom_type', 'properties', 'geometry', 'draw_geometry', 'ring_lens', 'total_points')
+    
+    # Item key -> slot holding its value ('type' is always 'Feature')
+    _KEY_SLOTS = {
+        'properties': 'properties',
+        'geometry': 'geometry',
+        '_draw_geometry': 'draw_geometry',
+        '_geom_kind': 'geom_type',
+        '_ring_lens': 'ring_lens',
+        '_total_points': 'total_points',
+    }
+    
+    def __init__(self, properties: Dict, geometry: Dict):
+        """
+        Create a feature
+        
+        Args:
+            properties: Feature attributes (NAME, STATE, ...)
+            geometry: GeoJSON Polygon/MultiPolygon geometry
+        """
+        self.name = properties.get('NAME', '')
+        self.geom_type = geometry.get('type')
+        self.properties = properties
+        self.geometry = geometry
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == 'type':
+            return 'Feature'
+        try:
+            return getattr(self, self._KEY_SLOTS[key])
+        except (KeyError, AttributeError):
+            # Unknown keys and summaries that were never computed behave like missing dict keys
+            raise KeyError(key) from None
+    
+    def __setitem__(self, key: str, value: Any):
+        if key not in self._KEY_SLOTS:
+            raise KeyError(f"Feature has no field {key!r}")
+        setattr(self, self._KEY_SLOTS[key], value)
+    
+    def __contains__(self, key: str) -> bool:
+        return key == 'type' or (key in self._KEY_SLOTS and hasattr(self, self._KEY_SLOTS[key]))
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup returning default for missing keys"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def keys(self) -> Tuple[str, ...]:
+        """Keys available through item access, in GeoJSON order"""
+        return ('type',) + tuple(key for key, slot in self._KEY_SLOTS.items() if hasattr(self, slot))
+    
+    def __repr__(self) -> str:
+        return f"Feature({self.name!r}, {self.geom_type!r})"
 
 class APIDataManager:
     """Manages loading and processing of geographic data from Census TIGERweb APIs"""
@@ -28,13 +194,32 @@ class APIDataManager:
         self.counties_data = None
         self._counties_by_region = {}  # Cache counties by region
         self._current_region = None  # Track which region's counties are currently loaded
-        self._state_to_region = {}
+        self._state_to_region = STATE_TO_REGION  # Shared state -> region lookup
         self._load_lock = Lock()
         
-        # Build reverse mapping from state to region
-        for region, states in REGIONS.items():
-            for state in states:
-                self._state_to_region[state] = region
+        # Shared keep-alive session so TLS setup is paid once per pooled connection
+        self.session = requests.Session()
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'  # TIGERweb compresses JSON ~10x
+        self.session.mount('https://', HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                                                   max_retries=HTTP_RETRIES))
+        
+        # Separate session with no retries mounted, used only for the ETag probe
+        self._probe_session = requests.Session()
+        
+        # Parsed state geometry, built once after the states are loaded
+        self.state_geoms: Dict[str, List[np.ndarray]] = {}  # Exterior rings as drawn
+        self.state_centroids: Dict[str, Tuple[float, float]] = {}  # Label positions
+        self.contiguous_features: List[Feature] = []  # Regional states drawn on the main map
+        self.inset_features: Dict[str, Feature] = {}  # Alaska/Hawaii features by name
+        self.state_simple_rings: Dict[str, List[np.ndarray]] = {}  # Simplified float64 exterior rings (shapely only)
+        
+        # Parallel per-feature arrays, in states_data['features'] order
+        self.state_names = np.array([], dtype=str)  # Feature NAME
+        self.state_geom_types = np.array([], dtype=np.uint8)  # GEOM_TYPE_CODES value
+        self.state_point_counts = np.array([], dtype=np.int32)  # Points in the exterior rings
+        
+        # STATE FIPS of each county, in counties_data['features'] order
+        self.county_fips = np.array([], dtype=str)
     
     def load_states_data(self, progress_callback=None) -> bool:
         """
@@ -55,17 +240,35 @@ class APIDataManager:
             params['returnGeometry'] = 'true'
             params['geometryPrecision'] = '6'  # Reasonable precision for display
             
-            response = requests.get(states_url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            api_data = response.json()
+            # Reuse the parsed states from an earlier run if the layer has not changed
+            cache_path = os.path.join(CACHE_DIR, f"states_v{STATES_CACHE_VERSION}.pkl")
+            cache_hit, etag = self._load_states_cache(cache_path, params)
+            if cache_hit:
+                print(f"✅ Loaded {len(self.states_data['features'])} states from cache")
+                return True
             
-            if 'error' in api_data:
-                raise Exception(f"API Error: {api_data['error']}")
+            if IJSON_AVAILABLE:
+                # Convert each feature as it is parsed, never holding the whole response
+                api_data = {'features': stream_features(states_url, params, timeout=30, session=self.session)}
+            else:
+                api_data = fetch_features(states_url, params, timeout=30, session=self.session)
+                
+                if 'error' in api_data:
+                    raise Exception(f"API Error: {api_data['error']}")
             
             # Convert ArcGIS format to GeoJSON format
             self.states_data = self._convert_to_geojson(api_data, 'states')
             
+            # A streamed error response simply has no features
+            if not self.states_data['features']:
+                raise Exception("API returned no state features")
+            
+            # Parse polygon rings and label centroids once for all later draws
+            self._build_state_geometry_cache()
+            self._build_state_arrays()
+            
+            self._save_states_cache(cache_path, etag)
+            
             print(f"Successfully loaded {len(self.states_data['features'])} states from API")
             return True
             
@@ -88,9 +291,7 @@ class APIDataManager:
             if progress_callback:
                 progress_callback("Getting total county count from Census API...")
             
-            count_response = requests.get(counties_url, params=total_records_parms, timeout=30)
-            count_response.raise_for_status()
-            count_data = count_response.json()
+            count_data = fetch_features(counties_url, total_records_parms, timeout=30, session=self.session)
             
             if 'error' in count_data:
                 raise Exception(f"API Error getting count: {count_data['error']}")
@@ -111,85 +312,23 @@ class APIDataManager:
             max_records = total_records
             print(f"Loading all {max_records} counties...")
             
-            for batch_start in range(1, max_records + 1, batch_size):
-                batch_end = min(batch_start + batch_size - 1, max_records)
-                
-                if progress_callback:
-                    progress = (batch_start - 1) / max_records * 100
-                    progress_callback(f"Fetching counties batch {batch_start}-{batch_end} ({progress:.1f}% complete)...")
-                
-                # Create where clause for this batch
-                where_clause = f"OBJECTID >= {batch_start} AND OBJECTID <= {batch_end}"
-                
-                print(f"Attempting batch {batch_start}-{batch_end}: {where_clause}")
-                
-                # Prepare parameters for this batch
-                batch_params = counties_params.copy()
-                batch_params['where'] = where_clause
-                batch_params['returnGeometry'] = 'true'
-                batch_params['geometryPrecision'] = '2'  # Lower precision for faster loading and smaller data
-                batch_params['resultRecordCount'] = batch_size  # Explicit record limit
-                
-                max_retries = 3
-                retry_count = 0
-                batch_success = False
-                
-                while retry_count < max_retries and not batch_success:
-                    try:
-                        # Fetch this batch with longer timeout
-                        batch_response = requests.get(counties_url, params=batch_params, timeout=90)
-                        batch_response.raise_for_status()
-                        batch_data = batch_response.json()
-                        
-                        if 'error' in batch_data:
-                            print(f"⚠️ API Error in batch {batch_start}-{batch_end}: {batch_data['error']}")
-                            if retry_count < max_retries - 1:
-                                retry_count += 1
-                                print(f"   Retrying... (attempt {retry_count + 1}/{max_retries})")
-                                time.sleep(1)
-                                continue
-                            else:
-                                failed_batches += 1
-                                break
-                        
-                        # Add features from this batch
-                        if 'features' in batch_data and batch_data['features']:
-                            batch_features = batch_data['features']
-                            all_features.extend(batch_features)
-                            successful_batches += 1
-                            print(f"✅ Batch {batch_start}-{batch_end}: {len(batch_features)} counties loaded")
-                            batch_success = True
-                        else:
-                            print(f"⚠️ Batch {batch_start}-{batch_end}: No features returned")
-                            if 'features' not in batch_data:
-                                print(f"   Response keys: {list(batch_data.keys())}")
-                            failed_batches += 1
-                            break
-                            
-                    except requests.exceptions.Timeout:
-                        print(f"⏰ Timeout for batch {batch_start}-{batch_end} (attempt {retry_count + 1})")
-                        retry_count += 1
-                        if retry_count < max_retries:
-                            time.sleep(2)
-                        else:
-                            failed_batches += 1
-                    except requests.exceptions.RequestException as e:
-                        print(f"🔗 Request error for batch {batch_start}-{batch_end}: {str(e)}")
-                        retry_count += 1
-                        if retry_count < max_retries:
-                            time.sleep(2)
-                        else:
-                            failed_batches += 1
-                    except Exception as e:
-                        print(f"❌ Unexpected error for batch {batch_start}-{batch_end}: {str(e)}")
-                        retry_count += 1
-                        if retry_count < max_retries:
-                            time.sleep(2)
-                        else:
-                            failed_batches += 1
-                
-                # No delay between batches for faster loading
-                # The API can handle rapid requests
+            batch_starts = list(range(1, max_records + 1, batch_size))
+            
+            batch_ends = [min(batch_start + batch_size - 1, max_records) for batch_start in batch_starts]
+            
+            # Fetch the batches concurrently over the shared session; map keeps OBJECTID order
+            with ThreadPoolExecutor(max_workers=COUNTY_FETCH_WORKERS) as ex:
+                batches = ex.map(self._fetch_county_batch, batch_starts, batch_ends, repeat(batch_size))
+                for completed, batch_features in enumerate(batches, 1):
+                    if batch_features is None:
+                        failed_batches += 1
+                    else:
+                        all_features.extend(batch_features)
+                        successful_batches += 1
+                    
+                    if progress_callback:
+                        progress = completed / len(batch_starts) * 100
+                        progress_callback(f"Fetched {completed}/{len(batch_starts)} county batches ({progress:.1f}% complete)...")
             
             print(f"\nBatch Summary: {successful_batches} successful, {failed_batches} failed")
             
@@ -208,6 +347,7 @@ class APIDataManager:
             }
             
             self.counties_data = self._convert_to_geojson(combined_data, 'counties')
+            self._build_county_arrays()
             
             print(f"Successfully loaded {len(self.counties_data['features'])} counties from API")
             return True
@@ -216,6 +356,67 @@ class APIDataManager:
             print(f"Error loading counties data: {str(e)}")
             return False
     
+    def _fetch_county_batch(self, batch_start: int, batch_end: int, batch_size: int) -> Optional[List[Dict]]:
+        """
+        Fetch one OBJECTID range of counties, retrying in-body API errors
+        
+        Args:
+            batch_start: First OBJECTID in the batch
+            batch_end: Last OBJECTID in the batch
+            batch_size: Maximum number of records to request
+            
+        Returns:
+            List of Esri JSON features, or None if the batch failed
+        """
+        # Create where clause for this batch
+        where_clause = f"OBJECTID >= {batch_start} AND OBJECTID <= {batch_end}"
+        
+        print(f"Attempting batch {batch_start}-{batch_end}: {where_clause}")
+        
+        # Prepare parameters for this batch
+        batch_params = counties_params.copy()
+        batch_params['where'] = where_clause
+        batch_params['returnGeometry'] = 'true'
+        batch_params['geometryPrecision'] = '2'  # Lower precision for faster loading and smaller data
+        batch_params['resultRecordCount'] = batch_size  # Explicit record limit
+        
+        # Transient HTTP failures are retried by the session's HTTP_RETRIES, but ArcGIS
+        # reports server errors as HTTP 200 with an 'error' body, so retry those here
+        attempts = HTTP_RETRIES.total + 1
+        for attempt in range(attempts):
+            try:
+                # Fetch this batch with longer timeout
+                batch_data = fetch_features(counties_url, batch_params, timeout=90, session=self.session)
+            except requests.exceptions.Timeout:
+                print(f"⏰ Timeout for batch {batch_start}-{batch_end}")
+                return None
+            except requests.exceptions.RequestException as e:
+                print(f"🔗 Request error for batch {batch_start}-{batch_end}: {str(e)}")
+                return None
+            except Exception as e:
+                print(f"❌ Unexpected error for batch {batch_start}-{batch_end}: {str(e)}")
+                return None
+            
+            if 'error' not in batch_data:
+                break
+            
+            print(f"⚠️ API Error in batch {batch_start}-{batch_end}: {batch_data['error']}")
+            if attempt == attempts - 1:
+                return None
+            print(f"   Retrying... (attempt {attempt + 2}/{attempts})")
+            time.sleep(HTTP_RETRIES.backoff_factor * (2 ** attempt))
+        
+        # Return features from this batch
+        if 'features' in batch_data and batch_data['features']:
+            batch_features = batch_data['features']
+            print(f"✅ Batch {batch_start}-{batch_end}: {len(batch_features)} counties loaded")
+            return batch_features
+        
+        print(f"⚠️ Batch {batch_start}-{batch_end}: No features returned")
+        if 'features' not in batch_data:
+            print(f"   Response keys: {list(batch_data.keys())}")
+        return None
+    
     def load_counties_for_region(self, region: str, progress_callback=None) -> bool:
         """
         Load counties data for a specific region from the TIGERweb API
@@ -234,6 +435,7 @@ class APIDataManager:
             if region in self._counties_by_region:
                 print(f"✅ Using cached counties for {region} region ({len(self._counties_by_region[region]['features'])} counties)")
                 self.counties_data = self._counties_by_region[region]
+                self._build_county_arrays()
                 self._current_region = region
                 if progress_callback:
                     progress_callback(f"Loaded {len(self.counties_data['features'])} cached counties for {region} region")
@@ -264,56 +466,16 @@ class APIDataManager:
             print(f"Loading counties for {len(state_fips_codes)} states in {region} region...")
             
             # Fetch counties for each state
-            all_features = []
-            successful_states = 0
-            failed_states = 0
+            if AIOHTTP_AVAILABLE:
+                # This runs on a worker thread, so it can own a private event loop
+                results = asyncio.run(self._fetch_states_counties_async(state_fips_codes, progress_callback))
+            else:
+                results = self._fetch_states_counties_threaded(state_fips_codes, progress_callback)
             
-            for i, fips_code in enumerate(state_fips_codes):
-                if progress_callback:
-                    progress = (i / len(state_fips_codes)) * 100
-                    progress_callback(f"Fetching counties for state {i+1}/{len(state_fips_codes)} ({progress:.1f}% complete)...")
-                
-                # Create where clause for this state
-                where_clause = f"STATE = '{fips_code}'"
-                
-                print(f"Fetching counties for state FIPS {fips_code}...")
-                
-                # Prepare parameters for this state
-                state_params = counties_params.copy()
-                state_params['where'] = where_clause
-                state_params['returnGeometry'] = 'true'
-                state_params['geometryPrecision'] = '2'  # Lower precision for faster loading
-                
-                try:
-                    # Fetch counties for this state
-                    response = requests.get(counties_url, params=state_params, timeout=60)
-                    response.raise_for_status()
-                    state_data = response.json()
-                    
-                    if 'error' in state_data:
-                        print(f"⚠️ API Error for state {fips_code}: {state_data['error']}")
-                        failed_states += 1
-                        continue
-                    
-                    # Add features from this state
-                    if 'features' in state_data and state_data['features']:
-                        state_features = state_data['features']
-                        all_features.extend(state_features)
-                        successful_states += 1
-                        print(f"✅ State {fips_code}: {len(state_features)} counties loaded")
-                    else:
-                        print(f"⚠️ State {fips_code}: No counties returned")
-                        failed_states += 1
-                        
-                except requests.exceptions.Timeout:
-                    print(f"⏰ Timeout for state {fips_code}, skipping...")
-                    failed_states += 1
-                except requests.exceptions.RequestException as e:
-                    print(f"🔗 Request error for state {fips_code}: {str(e)}")
-                    failed_states += 1
-                except Exception as e:
-                    print(f"❌ Unexpected error for state {fips_code}: {str(e)}")
-                    failed_states += 1
+            loaded = [state_features for state_features in results if state_features is not None]
+            successful_states = len(loaded)
+            failed_states = len(results) - successful_states
+            all_features = list(chain.from_iterable(loaded))
             
             print(f"\nState Summary: {successful_states} successful, {failed_states} failed")
             
@@ -333,6 +495,14 @@ class APIDataManager:
             
             self.counties_data = self._convert_to_geojson(combined_data, 'counties')
             
+            # Draw and hit-test on simplified outlines; geometry keeps the full resolution
+            if SHAPELY_AVAILABLE:
+                if progress_callback:
+                    progress_callback("Simplifying county outlines...")
+                self._simplify_counties(self.counties_data['features'])
+            
+            self._build_county_arrays()
+            
             # Cache the counties data for this region
             self._counties_by_region[region] = self.counties_data
             self._current_region = region
@@ -344,6 +514,156 @@ class APIDataManager:
             print(f"Error loading counties data for region {region}: {str(e)}")
             return False
     
+    def _fetch_states_counties_threaded(self, fips_codes: List[str], progress_callback=None) -> List[Optional[List[Dict]]]:
+        """
+        Fetch every state's counties concurrently over the shared requests session
+        
+        Args:
+            fips_codes: STATE FIPS codes to fetch
+            progress_callback: Optional callback function for progress updates
+            
+        Returns:
+            Per-state feature lists (None for failed states), in fips_codes order
+        """
+        results = []
+        with ThreadPoolExecutor(max_workers=COUNTY_FETCH_WORKERS) as ex:
+            # map keeps state order, so the region's counties come out grouped by state
+            for completed, state_features in enumerate(ex.map(self._fetch_state_counties, fips_codes), 1):
+                results.append(state_features)
+                self._report_state_progress(completed, len(fips_codes), progress_callback)
+        
+        return results
+    
+    async def _fetch_states_counties_async(self, fips_codes: List[str], progress_callback=None) -> List[Optional[List[Dict]]]:
+        """
+        Fetch every state's counties concurrently with aiohttp on a single event loop
+        
+        Args:
+            fips_codes: STATE FIPS codes to fetch
+            progress_callback: Optional callback function for progress updates
+            
+        Returns:
+            Per-state feature lists (None for failed states), in fips_codes order
+        """
+        timeout = aiohttp.ClientTimeout(total=60)
+        connector = aiohttp.TCPConnector(limit=HTTP_POOL_SIZE)
+        completed = 0
+        
+        def on_done(_task):
+            nonlocal completed
+            completed += 1
+            self._report_state_progress(completed, len(fips_codes), progress_callback)
+        
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            tasks = [asyncio.ensure_future(self._fetch_state_counties_async(session, fips_code))
+                     for fips_code in fips_codes]
+            for task in tasks:
+                task.add_done_callback(on_done)
+            
+            # gather keeps state order, matching the threaded fallback
+            return await asyncio.gather(*tasks)
+    
+    def _report_state_progress(self, completed: int, total: int, progress_callback=None):
+        """Report how many states' counties have been fetched"""
+        if progress_callback:
+            progress = completed / total * 100
+            progress_callback(f"Fetched counties for {completed}/{total} states ({progress:.1f}% complete)...")
+    
+    def _state_counties_params(self, fips_code: str) -> Dict:
+        """Build the county query parameters for one state"""
+        # Create where clause for this state
+        where_clause = f"STATE = '{fips_code}'"
+        
+        print(f"Fetching counties for state FIPS {fips_code}...")
+        
+        # Prepare parameters for this state
+        state_params = counties_params.copy()
+        state_params['where'] = where_clause
+        state_params['returnGeometry'] = 'true'
+        state_params['geometryPrecision'] = '2'  # Lower precision for faster loading
+        return state_params
+    
+    def _state_counties_features(self, fips_code: str, state_data: Dict) -> Optional[List[Dict]]:
+        """Extract one state's county features from a decoded response, or None on failure"""
+        if 'error' in state_data:
+            print(f"⚠️ API Error for state {fips_code}: {state_data['error']}")
+            return None
+        
+        # Return features from this state
+        if 'features' in state_data and state_data['features']:
+            state_features = state_data['features']
+            print(f"✅ State {fips_code}: {len(state_features)} counties loaded")
+            return state_features
+        
+        print(f"⚠️ State {fips_code}: No counties returned")
+        return None
+    
+    def _fetch_state_counties(self, fips_code: str) -> Optional[List[Dict]]:
+        """
+        Fetch all counties of one state
+        
+        Args:
+            fips_code: Two-digit STATE FIPS code
+            
+        Returns:
+            List of Esri JSON features, or None if the request failed
+        """
+        try:
+            # Fetch counties for this state
+            state_data = fetch_features(counties_url, self._state_counties_params(fips_code), timeout=60, session=self.session)
+            return self._state_counties_features(fips_code, state_data)
+                
+        except requests.exceptions.Timeout:
+            print(f"⏰ Timeout for state {fips_code}, skipping...")
+        except requests.exceptions.RequestException as e:
+            print(f"🔗 Request error for state {fips_code}: {str(e)}")
+        except Exception as e:
+            print(f"❌ Unexpected error for state {fips_code}: {str(e)}")
+        return None
+    
+    async def _fetch_state_counties_async(self, session, fips_code: str) -> Optional[List[Dict]]:
+        """
+        Fetch all counties of one state with aiohttp
+        
+        Args:
+            session: aiohttp.ClientSession shared by all states
+            fips_code: Two-digit STATE FIPS code
+            
+        Returns:
+            List of Esri JSON features, or None if the request failed
+        """
+        params = self._state_counties_params(fips_code)
+        attempts = HTTP_RETRIES.total + 1
+        
+        # Mirror HTTP_RETRIES (which only covers the requests session): retry
+        # gateway errors, timeouts and dropped connections with exponential backoff
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                async with session.get(counties_url, params=params) as response:
+                    if response.status in HTTP_RETRIES.status_forcelist and not last_attempt:
+                        print(f"🔁 HTTP {response.status} for state {fips_code}, retrying...")
+                    else:
+                        response.raise_for_status()
+                        state_data = parse_json(await response.read())
+                        return self._state_counties_features(fips_code, state_data)
+            
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                if last_attempt:
+                    print(f"⏰ Giving up on state {fips_code} after {attempts} attempts: {str(e) or 'timeout'}")
+                    return None
+                print(f"🔁 Connection problem for state {fips_code}, retrying...")
+            except aiohttp.ClientError as e:
+                print(f"🔗 Request error for state {fips_code}: {str(e)}")
+                return None
+            except Exception as e:
+                print(f"❌ Unexpected error for state {fips_code}: {str(e)}")
+                return None
+            
+            await asyncio.sleep(HTTP_RETRIES.backoff_factor * (2 ** attempt))
+        
+        return None
+    
     def _convert_to_geojson(self, api_data: Dict, data_type: str) -> Dict:
         """
         Convert ArcGIS API response to GeoJSON format
@@ -353,7 +673,7 @@ class APIDataManager:
             data_type: 'states' or 'counties'
             
         Returns:
-            Data in GeoJSON format
+            GeoJSON FeatureCollection dict whose features are Feature objects
         """
         features = []
         
@@ -365,35 +685,33 @@ class APIDataManager:
             attributes = feature.get('attributes', {})
             properties = {}
             
+            # Names and codes repeat across features and are compared often, so
+            # intern them: one shared string each and identity-fast equality
             if data_type == 'states':
                 # Get state name and generate abbreviation if needed
-                state_name = attributes.get('NAME', '')
+                state_name = sys.intern(attributes.get('NAME', ''))
                 state_abbr = attributes.get('STATE_ABBR', attributes.get('STUSPS', ''))
                 
                 # If no abbreviation available, generate from name
                 if not state_abbr:
                     state_abbr = self._get_state_abbreviation(state_name)
+                state_abbr = sys.intern(state_abbr)
                 
                 properties = {
                     'NAME': state_name,
                     'STATE_ABBR': state_abbr,
                     'STUSPS': state_abbr,
-                    'STATE': attributes.get('STATE', '')  # FIPS code for querying counties
+                    'STATE': sys.intern(attributes.get('STATE', ''))  # FIPS code for querying counties
                 }
             elif data_type == 'counties':
                 properties = {
-                    'NAME': attributes.get('NAME', ''),
-                    'STATE': attributes.get('STATE', ''),
+                    'NAME': sys.intern(attributes.get('NAME', '')),
+                    'STATE': sys.intern(attributes.get('STATE', '')),
                     'POP100': attributes.get('POP100', 0)
                 }
             
             # Create GeoJSON feature
-            geojson_feature = {
-                'type': 'Feature',
-                'properties': properties,
-                'geometry': geometry
-            }
-            features.append(geojson_feature)
+            features.append(Feature(properties, geometry))
         
         return {
             'type': 'FeatureCollection',
@@ -409,18 +727,16 @@ class APIDataManager:
             arcgis_geometry: ArcGIS geometry object
             
         Returns:
-            GeoJSON geometry object with lat/lon coordinates
+            GeoJSON geometry object whose rings are (N, 2) float64 lon/lat arrays
         """
         if not arcgis_geometry or 'rings' not in arcgis_geometry:
             return {'type': 'Polygon', 'coordinates': []}
         
         rings = arcgis_geometry['rings']
         
-        # Convert all rings from Web Mercator to lat/lon
-        converted_rings = []
-        for ring in rings:
-            converted_ring = [self._web_mercator_to_latlon(x, y) for x, y in ring]
-            converted_rings.append(converted_ring)
+        # Convert all rings from Web Mercator to lat/lon, one packed array per ring
+        converted_rings = [self._web_mercator_to_latlon(np.asarray(ring, dtype=np.float64).reshape(-1, 2))
+                           for ring in rings]
         
         if len(converted_rings) == 1:
             # Simple polygon
@@ -447,36 +763,293 @@ class APIDataManager:
                     'coordinates': polygons
                 }
     
-    def _web_mercator_to_latlon(self, x: float, y: float) -> List[float]:
+    def _probe_states_etag(self, params: Dict) -> Optional[str]:
         """
-        Convert Web Mercator (EPSG:3857) coordinates to lat/lon (WGS84)
+        Ask the server for the current ETag of the states response
         
         Args:
-            x: X coordinate in Web Mercator (meters)
-            y: Y coordinate in Web Mercator (meters)
+            params: Query parameters the states will be fetched with
             
         Returns:
-            [longitude, latitude] in degrees
+            The ETag, or None if the probe failed or the server sent none
+        """
+        try:
+            response = self._probe_session.head(states_url, params=params, timeout=ETAG_PROBE_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️ Could not check states ETag: {str(e)}")
+            return None
+        
+        if not response.ok:
+            print(f"⚠️ States ETag check returned HTTP {response.status_code}")
+            return None
+        return response.headers.get('ETag')
+    
+    def _load_states_cache(self, path: str, params: Dict) -> Tuple[bool, Optional[str]]:
+        """
+        Restore the parsed states and their derived geometry from a cache file
+        
+        A cache younger than STATES_CACHE_TTL is used without any request; an older
+        one only if the server's ETag still matches the one it was saved with.
+        
+        Args:
+            path: Pickle written by _save_states_cache
+            params: Query parameters the states would be fetched with
+            
+        Returns:
+            (loaded, etag): whether the cache was restored, and the server's ETag
+            if it was probed (None otherwise) for _save_states_cache to store
+        """
+        cached = None
+        if os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    cached = pickle.load(f)
+                if not isinstance(cached, dict) or 'attrs' not in cached:
+                    raise ValueError("unexpected cache layout")
+                age = time.time() - os.path.getmtime(path)
+            except Exception as e:
+                print(f"⚠️ Ignoring unreadable states cache: {str(e)}")
+                cached = None
+        
+        if cached is not None and age <= STATES_CACHE_TTL:
+            etag = cached['etag']
+        else:
+            # Only reached when the states would be downloaded anyway
+            etag = self._probe_states_etag(params)
+            if cached is None or not etag or etag != cached['etag']:
+                return False, etag
+            
+            # Unchanged on the server, so the cache is good for another TTL
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        
+        for attr, value in cached['attrs'].items():
+            setattr(self, attr, value)
+        return True, etag
+    
+    def _save_states_cache(self, path: str, etag: Optional[str]):
+        """
+        Pickle the parsed states and their derived geometry for later runs
+        
+        Args:
+            path: Destination pickle
+            etag: ETag of the states response, or None if the server sent none
+        """
+        cached = {'etag': etag, 'attrs': {attr: getattr(self, attr) for attr in STATES_CACHE_ATTRS}}
+        
+        # Write then rename so a concurrent run never reads a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            # Caching is an optimization; a pickling or disk error must not fail the load
+            print(f"⚠️ Could not write states cache: {str(e)}")
+        finally:
+            # Only left behind when the write or rename failed
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _build_state_geometry_cache(self):
+        """
+        Convert each state's exterior rings to float32 arrays, compute label
+        centroids and split features into continental and inset groups, so
+        drawing code never has to re-parse or re-filter the GeoJSON
+        """
+        self.state_geoms = {}
+        self.state_centroids = {}
+        self.contiguous_features = []
+        self.inset_features = {}
+        self.state_simple_rings = {}
+        
+        for feature in self.states_data['features']:
+            state_name = feature['properties']['NAME']
+            
+            # Split features once: insets, continental map, or unassigned territory
+            if state_name in INSET_STATES:
+                self.inset_features[state_name] = feature
+            elif state_name in STATE_TO_REGION:
+                self.contiguous_features.append(feature)
+            geometry = feature['geometry']
+            geom_type = geometry['type']
+            
+            if geom_type == 'Polygon':
+                if not geometry['coordinates']:
+                    continue
+                exterior = np.asarray(geometry['coordinates'][0], dtype=np.float64)
+                rings = [exterior]
+                largest = exterior
+            elif geom_type == 'MultiPolygon':
+                exteriors = [np.asarray(polygon_coords[0], dtype=np.float64)
+                             for polygon_coords in geometry['coordinates']]
+                # Skip very small islands (less than 5 points) for visual clarity
+                rings = [coords for coords in exteriors if len(coords) >= 5]
+                largest = self._largest_ring(exteriors)
+            else:
+                continue
+            
+            self.state_geoms[state_name] = [np.ascontiguousarray(ring, dtype=np.float32) for ring in rings]
+            
+            # Centroids use the float64 coordinates to keep the shoelace sums accurate
+            if largest is not None:
+                centroid = self._calculate_polygon_centroid(largest)
+                if centroid:
+                    self.state_centroids[state_name] = centroid
+            
+            if SHAPELY_AVAILABLE:
+                self._simplify_state(state_name, geometry)
+    
+    def _build_state_arrays(self):
+        """Summarize every state feature into parallel NumPy arrays for dense scans"""
+        features = self.states_data['features']
+        
+        # Interned kinds make the repeated type checks identity comparisons
+        geom_types = [sys.intern(feature['geometry']['type']) for feature in features]
+        point_counts = []
+        for feature, geom_type in zip(features, geom_types):
+            coordinates = feature['geometry'].get('coordinates') or []
+            if geom_type == 'Polygon':
+                exteriors = coordinates[:1]
+            elif geom_type == 'MultiPolygon':
+                exteriors = [polygon_coords[0] for polygon_coords in coordinates if polygon_coords]
+            else:
+                exteriors = []
+            
+            # Cache on the feature so callers never walk the rings again
+            ring_lens = np.fromiter((ring.shape[0] for ring in exteriors), dtype=np.int32, count=len(exteriors))
+            feature['_geom_kind'] = geom_type
+            feature['_ring_lens'] = ring_lens
+            feature['_total_points'] = int(ring_lens.sum())
+            point_counts.append(feature['_total_points'])
+        
+        self.state_names = np.array([feature['properties']['NAME'] for feature in features], dtype=str)
+        self.state_geom_types = np.array([GEOM_TYPE_CODES.get(geom_type, 0) for geom_type in geom_types], dtype=np.uint8)
+        self.state_point_counts = np.asarray(point_counts, dtype=np.int32)
+    
+    def _build_county_arrays(self):
+        """Index every county's STATE FIPS once per counties_data assignment for region lookups"""
+        features = self.counties_data['features']
+        self.county_fips = np.array([feature['properties'].get('STATE', '') for feature in features], dtype=str)
+    
+    def _simplify_counties(self, features: List[Feature]):
         """
-        import math
+        Store a Douglas-Peucker simplified copy of each county for drawing and hover,
+        leaving the full-resolution geometry in place for export and precise work
         
-        # Web Mercator to WGS84 conversion
-        # Earth radius in meters
-        earth_radius = 6378137.0
+        Args:
+            features: County features from _convert_to_geojson (draw_geometry is set in place)
+        """
+        for feature in features:
+            if not feature.geometry.get('coordinates'):
+                continue
+            
+            simplified = shape(feature.geometry).simplify(COUNTY_SIMPLIFY_TOLERANCE, preserve_topology=False)
+            
+            # Tiny counties can collapse entirely - they are drawn from the original outline
+            if simplified.is_empty or simplified.geom_type not in ('Polygon', 'MultiPolygon'):
+                continue
+            
+            polygons = [[np.asarray(polygon.exterior.coords, dtype=np.float64)]
+                        + [np.asarray(interior.coords, dtype=np.float64) for interior in polygon.interiors]
+                        for polygon in getattr(simplified, 'geoms', [simplified]) if not polygon.is_empty]
+            
+            if simplified.geom_type == 'MultiPolygon':
+                feature.draw_geometry = {'type': 'MultiPolygon', 'coordinates': polygons}
+            else:
+                feature.draw_geometry = {'type': 'Polygon', 'coordinates': polygons[0]}
+    
+    def _simplify_state(self, state_name: str, geometry: Dict):
+        """
+        Cache a Douglas-Peucker simplified copy of a state for hit-testing and highlights
+        
+        Args:
+            state_name: Name of the state
+            geometry: GeoJSON Polygon/MultiPolygon geometry
+        """
+        original = shape(geometry)
+        simplified = original.simplify(STATE_SIMPLIFY_TOLERANCE, preserve_topology=False)
+        
+        # Small shapes can collapse entirely - keep their original outline
+        if simplified.is_empty or simplified.geom_type not in ('Polygon', 'MultiPolygon'):
+            simplified = original
+        
+        polygons = simplified.geoms if simplified.geom_type == 'MultiPolygon' else [simplified]
+        self.state_simple_rings[state_name] = [np.asarray(polygon.exterior.coords, dtype=np.float64)
+                                               for polygon in polygons if not polygon.is_empty]
+    
+    def _largest_ring(self, rings: List[np.ndarray]) -> Optional[np.ndarray]:
+        """Find the ring with the largest area (more accurate than just point count)"""
+        largest_polygon = None
+        max_area = 0
+        
+        for coords in rings:
+            if len(coords) < 3:
+                continue
+            
+            # Calculate approximate area using shoelace formula, plus the closing edge
+            x = coords[:, 0]
+            y = coords[:, 1]
+            cross_sum = (x[:-1] * y[1:] - x[1:] * y[:-1]).sum() + (x[-1] * y[0] - x[0] * y[-1])
+            area = 0.5 * abs(cross_sum)
+            
+            if area > max_area:
+                max_area = area
+                largest_polygon = coords
+        
+        return largest_polygon
+    
+    def _calculate_polygon_centroid(self, coords: np.ndarray) -> Optional[Tuple[float, float]]:
+        """Calculate a better centroid of a polygon using area-weighted method"""
+        if len(coords) < 3:
+            return None
+        
+        # Calculate area-weighted centroid (more accurate for irregular shapes)
+        x = coords[:, 0]
+        y = coords[:, 1]
+        
+        # Shoelace formula over consecutive vertices, working on views of the input.
+        # The closing edge (last -> first) is added separately and is zero for closed rings.
+        cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+        closing = x[-1] * y[0] - x[0] * y[-1]
+        area = 0.5 * (cross.sum() + closing)
+        
+        if abs(area) < 1e-10:  # Avoid division by zero
+            # Fallback to simple mean for degenerate polygons
+            return (float(np.mean(x)), float(np.mean(y)))
+        
+        cx = (((x[:-1] + x[1:]) * cross).sum() + (x[-1] + x[0]) * closing) / (6.0 * area)
+        cy = (((y[:-1] + y[1:]) * cross).sum() + (y[-1] + y[0]) * closing) / (6.0 * area)
+        
+        return (float(cx), float(cy))
+    
+    def _web_mercator_to_latlon(self, coords: np.ndarray) -> np.ndarray:
+        """
+        Convert Web Mercator (EPSG:3857) coordinates to lat/lon (WGS84)
+        
+        Args:
+            coords: (N, 2) array of x/y coordinates in Web Mercator (meters)
+            
+        Returns:
+            (N, 2) float64 array of [longitude, latitude] in degrees
+        """
+        lonlat = np.empty_like(coords)
         
         # Convert X to longitude
-        lon = (x / earth_radius) * (180.0 / math.pi)
+        lonlat[:, 0] = np.degrees(coords[:, 0] / EARTH_RADIUS)
         
         # Convert Y to latitude
-        lat = (2 * math.atan(math.exp(y / earth_radius)) - math.pi / 2) * (180.0 / math.pi)
+        lonlat[:, 1] = np.degrees(2 * np.arctan(np.exp(coords[:, 1] / EARTH_RADIUS)) - np.pi / 2)
         
-        return [lon, lat]
+        return lonlat
     
     def _get_state_abbreviation(self, state_name: str) -> str:
         """Get state abbreviation from full name"""
         # Import the abbreviations dictionary
         try:
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
             from geometry_query_params.us_states_abbreviations import get_state_abbreviation
             return get_state_abbreviation(state_name)
         except:
@@ -487,6 +1060,8 @@ class APIDataManager:
         """
         Load states data and optionally counties data asynchronously
         
+        Blocking wrapper around load_all for callers on a plain worker thread.
+        
         Args:
             progress_callback: Optional callback function for progress updates
             load_counties: Whether to load counties data (default False for faster startup)
@@ -494,22 +1069,50 @@ class APIDataManager:
         Returns:
             True if successful, False otherwise
         """
-        with self._load_lock:
-            try:
-                # Load states data first
-                if not self.load_states_data(progress_callback):
-                    return False
-                
-                # Optionally load counties data (can be loaded later when needed)
-                if load_counties:
-                    if not self.load_counties_data(progress_callback):
-                        return False
-                
-                return True
-                
-            except Exception as e:
-                print(f"Error in async data loading: {str(e)}")
-                return False
+        try:
+            return asyncio.run(self.load_all(progress_callback, load_counties))
+        except Exception as e:
+            print(f"Error in async data loading: {str(e)}")
+            return False
+    
+    async def load_all(self, progress_callback=None, load_counties: bool = False) -> bool:
+        """
+        Load states data and optionally counties data from a coroutine
+        
+        The states and counties layers are independent queries, so their blocking
+        loaders run side by side on the event loop's default executor.
+        
+        Args:
+            progress_callback: Optional callback function for progress updates
+            load_counties: Whether to load counties data as well
+            
+        Returns:
+            True if every requested layer loaded, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        
+        # Serialize with other loads; acquire off the loop so it is never blocked
+        await loop.run_in_executor(None, self._load_lock.acquire)
+        try:
+            loaders = [loop.run_in_executor(None, self.load_states_data, progress_callback)]
+            if load_counties:
+                loaders.append(loop.run_in_executor(None, self.load_counties_data, progress_callback))
+            
+            results = await asyncio.gather(*loaders)
+            return all(results)
+        finally:
+            self._load_lock.release()
+    
+    def iter_features(self) -> Iterator[Feature]:
+        """
+        Iterate over the loaded state features without copying the list
+        
+        Returns:
+            Iterator over GeoJSON state features (empty if nothing is loaded)
+        """
+        if not self.states_data:
+            return iter(())
+        return iter(self.states_data['features'])
     
     def is_data_loaded(self) -> bool:
         """Check if states data is loaded (counties are optional)"""
@@ -568,20 +1171,16 @@ class APIDataManager:
         if not self.counties_data:
             return []
         
+        # STATE FIPS codes of the region's states
         states_in_region = self.get_states_in_region(region)
-        regional_counties = []
+        region_fips = [feature['properties'].get('STATE', '') for feature in self.iter_features()
+                       if feature['properties']['NAME'] in states_in_region]
         
-        for feature in self.counties_data['features']:
-            # Match by state code/name
-            state_code = feature['properties'].get('STATE', '')
-            # Note: You may need to add logic to convert state codes to names
-            # for proper matching with the regional definitions
-            
-            # For now, this is a placeholder - you'll need to implement
-            # the state code to state name mapping
-            regional_counties.append(feature)
+        # One vectorized membership test over the precomputed county STATE codes
+        features = self.counties_data['features']
+        keep = np.flatnonzero(np.isin(self.county_fips, region_fips))
         
-        return regional_counties
+        return [features[i] for i in keep]
 
 if __name__ == "__main__":
     # Test the API data manager
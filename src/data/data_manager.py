@@ -7,7 +7,15 @@ groupings as specified in the requirements.
 
 import json
 import os
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
+import matplotlib.colors as mcolors
+
+# Optional: orjson parses large GeoJSON payloads several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Regional definitions as specified in the requirements
 REGIONS = {
@@ -44,6 +52,40 @@ REGION_COLORS = {
     'Southwest': '#FECA57'  # Yellow
 }
 
+# States drawn in their own inset maps rather than on the continental map
+INSET_STATES = {'Alaska', 'Hawaii'}
+
+# Direct lookups for drawing loops: state name -> region, region -> Matplotlib RGBA
+STATE_TO_REGION = {state: region for region, states in REGIONS.items() for state in states}
+REGION_RGBA = {region: mcolors.to_rgba(color) for region, color in REGION_COLORS.items()}
+
+def parse_json(raw: bytes) -> Any:
+    """
+    Parse a JSON document from raw bytes, using orjson when it is installed
+    
+    Args:
+        raw: UTF-8 encoded JSON bytes (e.g. a file's contents or an HTTP body)
+        
+    Returns:
+        The decoded Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def load_json_file(path: str) -> Any:
+    """
+    Read and parse a JSON/GeoJSON file in one pass
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        The decoded Python object
+    """
+    with open(path, 'rb') as f:
+        return parse_json(f.read())
+
 class DataManager:
     """Manages loading and processing of GeoJSON data"""
     
@@ -51,12 +93,7 @@ class DataManager:
         self.data_dir = data_dir
         self.states_data = None
         self.counties_data = None
-        self._state_to_region = {}
-        
-        # Build reverse mapping from state to region
-        for region, states in REGIONS.items():
-            for state in states:
-                self._state_to_region[state] = region
+        self._state_to_region = STATE_TO_REGION  # Shared state -> region lookup
     
     def load_data(self) -> bool:
         """
@@ -69,8 +106,7 @@ class DataManager:
             # Load states data
             states_path = os.path.join(self.data_dir, "states.geojson")
             if os.path.exists(states_path):
-                with open(states_path, 'r', encoding='utf-8') as f:
-                    self.states_data = json.load(f)
+                self.states_data = load_json_file(states_path)
                 print(f"Loaded {len(self.states_data['features'])} states")
             else:
                 print(f"Warning: {states_path} not found")
@@ -79,8 +115,7 @@ class DataManager:
             # Load counties data
             counties_path = os.path.join(self.data_dir, "counties.geojson")
             if os.path.exists(counties_path):
-                with open(counties_path, 'r', encoding='utf-8') as f:
-                    self.counties_data = json.load(f)
+                self.counties_data = load_json_file(counties_path)
                 print(f"Loaded {len(self.counties_data['features'])} counties")
             else:
                 print(f"Warning: {counties_path} not found")
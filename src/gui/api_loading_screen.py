@@ -60,8 +60,6 @@ class APIDataLoadingManager:
     
     def _schedule_next_step(self, callback, delay_ms):
         """Schedule next loading step without blocking the main thread"""
-        import threading
-        
         def delayed_callback():
             time.sleep(delay_ms / 1000.0)  # Convert to seconds
             callback()
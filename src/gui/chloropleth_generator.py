@@ -10,13 +10,86 @@ from tkinter import ttk, messagebox, filedialog
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-from matplotlib.patches import Polygon
+from matplotlib.patches import Polygon, Patch
+from matplotlib.path import Path
+import matplotlib.cm as cm
 import numpy as np
-from typing import Optional, Dict, List, Callable
+from typing import Optional, Dict, List, Callable, Tuple
+import functools
+import base64
+from io import BytesIO
 import webbrowser
 import tempfile
 import os
 
+@functools.lru_cache(maxsize=32)
+def _fmt_break_labels(breaks_tuple: Tuple[int, ...]) -> Tuple[str, ...]:
+    """Format legend labels ("lower - upper") for a tuple of class breaks"""
+    labels = []
+    lower = 0
+    for upper in breaks_tuple:
+        # Format numbers with commas
+        labels.append(f"{lower:,} - {upper:,}")
+        lower = upper
+    return tuple(labels)
+
+# HTML export templates (bytes, so the base64 image can be written without re-encoding)
+_HTML_EXPORT_HEAD = b"""<!DOCTYPE html>
+<html>
+<head>
+    <title>%(region)s Region Population Map</title>
+    <meta charset="UTF-8">
+    <style>
+        body { 
+            font-family: Arial, sans-serif; 
+            text-align: center; 
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: white;
+            padding: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #2c3e50;
+            margin-bottom: 10px;
+        }
+        .info {
+            color: #7f8c8d;
+            margin: 5px 0;
+        }
+        img { 
+            max-width: 100%%; 
+            height: auto;
+            margin: 20px 0;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+        }
+        .footer {
+            margin-top: 20px;
+            color: #95a5a6;
+            font-size: 12px;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>%(region)s Region Population Chloropleth</h1>
+        <p class="info">Classification Method: %(method)s</p>
+        <p class="info">Color Scheme: %(scheme)s</p>
+        <img src="data:image/png;base64,"""
+
+_HTML_EXPORT_TAIL = b"""" alt="%(region)s Region Population Map">
+        <p class="footer">Generated by Austin Averill's Population By Region Viewer</p>
+    </div>
+</body>
+</html>
+"""
+
 class ChloroplethGenerator:
     """Chloropleth map generator window"""
     
@@ -53,6 +126,7 @@ class ChloroplethGenerator:
         self.hover_timer = None  # Timer for 1-second delay
         self.last_hover_time = 0
         self.current_hover_county = None
+        self._county_rasters = {}  # Axis -> rasterized county index image for hover hit-testing
         
         # GUI components
         self.main_frame = None
@@ -411,6 +485,7 @@ class ChloroplethGenerator:
         
         self.counties_data = []  # Reset county data
         self.county_patches = []  # Reset patches
+        self._county_rasters = {}  # Patches changed - rebuild hover rasters on demand
         
         # Get STATE FIPS codes for Alaska (02) and Hawaii (15)
         alaska_fips = '02'
@@ -451,8 +526,8 @@ class ChloroplethGenerator:
                 else:
                     target_ax = self.ax
                 
-                # Handle geometry
-                geometry = county.get('geometry', {})
+                # Handle geometry (the simplified outline when the loader made one)
+                geometry = county.get('_draw_geometry') or county.get('geometry', {})
                 geom_type = geometry.get('type', '')
                 
                 if geom_type == 'Polygon':
@@ -665,7 +740,6 @@ class ChloroplethGenerator:
         breaks = self._classify_data(valid_populations, method, num_classes)
         
         # Get colormap
-        import matplotlib.cm as cm
         colormap = cm.get_cmap(scheme, num_classes)
         
         # Update progress
@@ -782,22 +856,15 @@ class ChloroplethGenerator:
         
         # Create legend entries
         legend_elements = []
-        from matplotlib.patches import Patch
         
         # Add class for "No Data"
         legend_elements.append(Patch(facecolor='#e0e0e0', edgecolor='black', label='No Data'))
         
-        # Add classes
-        prev_break = 0
-        for i in range(num_classes):
+        # Add classes (labels are cached per set of breaks)
+        labels = _fmt_break_labels(tuple(int(b) for b in breaks[:num_classes]))
+        for i, label in enumerate(labels):
             color = colormap(i)
-            lower = prev_break if i == 0 else breaks[i-1]
-            upper = breaks[i]
-            
-            # Format numbers with commas
-            label = f"{int(lower):,} - {int(upper):,}"
             legend_elements.append(Patch(facecolor=color, edgecolor='black', label=label))
-            prev_break = breaks[i]
         
         # Add legend with region-specific positioning
         if self.region == "Southwest":
@@ -848,9 +915,6 @@ class ChloroplethGenerator:
     def _export_to_html(self):
         """Export current map to HTML file with embedded base64 image"""
         try:
-            import base64
-            from io import BytesIO
-            
             # Create a simple HTML file with the current map
             filename = filedialog.asksaveasfilename(
                 title="Export Map to HTML",
@@ -859,73 +923,26 @@ class ChloroplethGenerator:
             )
             
             if filename:
-                # Save matplotlib figure to a BytesIO buffer
+                # Save matplotlib figure into a buffer freed once the export is written
                 buffer = BytesIO()
                 self.figure.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-                buffer.seek(0)
                 
-                # Encode the image to base64
-                img_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-                buffer.close()
+                # Encode the image to base64 straight from the buffer's memory
+                with buffer.getbuffer() as png_view:
+                    img_base64 = base64.b64encode(png_view)
                 
-                # Create HTML content with embedded base64 image
-                html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>{self.region} Region Population Map</title>
-    <meta charset="UTF-8">
-    <style>
-        body {{ 
-            font-family: Arial, sans-serif; 
-            text-align: center; 
-            margin: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }}
-        .info {{
-            color: #7f8c8d;
-            margin: 5px 0;
-        }}
-        img {{ 
-            max-width: 100%; 
-            height: auto;
-            margin: 20px 0;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-        }}
-        .footer {{
-            margin-top: 20px;
-            color: #95a5a6;
-            font-size: 12px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>{self.region} Region Population Chloropleth</h1>
-        <p class="info">Classification Method: {self.classification_method.get()}</p>
-        <p class="info">Color Scheme: {self.color_scheme.get()}</p>
-        <img src="data:image/png;base64,{img_base64}" alt="{self.region} Region Population Map">
-        <p class="footer">Generated by Austin Averill's Population By Region Viewer</p>
-    </div>
-</body>
-</html>
-"""
+                # Substitute the page details into the HTML templates
+                values = {
+                    b'region': self.region.encode('utf-8'),
+                    b'method': self.classification_method.get().encode('utf-8'),
+                    b'scheme': self.color_scheme.get().encode('utf-8'),
+                }
                 
-                # Write HTML file
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
+                # Write HTML file piece by piece (the base64 payload is already ASCII)
+                with open(filename, 'wb') as f:
+                    f.write(_HTML_EXPORT_HEAD % values)
+                    f.write(img_base64)
+                    f.write(_HTML_EXPORT_TAIL % values)
                 
                 messagebox.showinfo("Export Complete", f"Map exported to {filename}")
                 
@@ -938,8 +955,6 @@ class ChloroplethGenerator:
     
     def _on_hover(self, event):
         """Handle mouse hover for county tooltips with 1-second delay"""
-        import time
-        
         # Hide tooltip immediately when mouse moves (before doing anything else)
         if self.hover_tooltip:
             self.hover_tooltip.remove()
@@ -962,18 +977,16 @@ class ChloroplethGenerator:
             self.current_hover_county = None
             return
         
-        # Find which county we're hovering over
+        # Find which county we're hovering over (single lookup in the county raster)
         hovered_county = None
-        mouse_point = (event.xdata, event.ydata)
+        x0, y0, raster = self._get_county_raster(event.inaxes)
+        row = int(event.y) - y0
+        col = int(event.x) - x0
         
-        for patch in self.county_patches:
-            # Check if this patch belongs to the current axis
-            if hasattr(patch, 'target_ax') and patch.target_ax == event.inaxes:
-                # Use matplotlib's contains method which returns (bool, dict)
-                contains, _ = patch.contains(event)
-                if contains:
-                    hovered_county = patch
-                    break
+        if 0 <= row < raster.shape[0] and 0 <= col < raster.shape[1]:
+            patch_idx = raster[row, col]
+            if patch_idx >= 0:
+                hovered_county = self.county_patches[patch_idx]
         
         if hovered_county and hasattr(hovered_county, 'county_data'):
             self.current_hover_county = hovered_county
@@ -982,6 +995,57 @@ class ChloroplethGenerator:
         else:
             self.current_hover_county = None
     
+    def _get_county_raster(self, ax):
+        """Get the county raster for an axis, rebuilding it if the view has changed"""
+        # The raster is only valid for the axis position and view limits it was built for
+        view_key = (ax.bbox.bounds, ax.viewLim.bounds)
+        
+        cached = self._county_rasters.get(ax)
+        if cached is None or cached[0] != view_key:
+            cached = (view_key, self._build_county_raster(ax))
+            self._county_rasters[ax] = cached
+        
+        return cached[1]
+    
+    def _build_county_raster(self, ax):
+        """
+        Rasterize the county patches of an axis at display resolution
+        
+        Args:
+            ax: Axis whose county patches should be rasterized
+            
+        Returns:
+            Tuple of (x origin, y origin, raster) where each raster pixel holds the
+            index of the county patch covering it in self.county_patches, or -1
+        """
+        x0 = int(ax.bbox.x0)
+        y0 = int(ax.bbox.y0)
+        width = int(np.ceil(ax.bbox.x1)) - x0
+        height = int(np.ceil(ax.bbox.y1)) - y0
+        raster = np.full((height, width), -1, dtype=np.int32)
+        
+        for patch_idx, patch in enumerate(self.county_patches):
+            if patch.target_ax is not ax:
+                continue
+            
+            # County outline in display (pixel) coordinates
+            verts = patch.get_transform().transform(patch.get_path().vertices)
+            
+            # Only test the pixels inside the county's bounding box
+            col0 = max(int(verts[:, 0].min()) - x0, 0)
+            col1 = min(int(np.ceil(verts[:, 0].max())) - x0, width)
+            row0 = max(int(verts[:, 1].min()) - y0, 0)
+            row1 = min(int(np.ceil(verts[:, 1].max())) - y0, height)
+            if col0 >= col1 or row0 >= row1:
+                continue
+            
+            cols, rows = np.meshgrid(np.arange(col0, col1), np.arange(row0, row1))
+            pixel_centers = np.column_stack([cols.ravel() + x0 + 0.5, rows.ravel() + y0 + 0.5])
+            inside = Path(verts).contains_points(pixel_centers).reshape(rows.shape)
+            raster[row0:row1, col0:col1][inside] = patch_idx
+        
+        return x0, y0, raster
+    
     def _show_county_tooltip(self, event, county_patch):
         """Show tooltip for a county after delay"""
         # Only show if we're still hovering over the same county
@@ -9,7 +9,9 @@ import tkinter as tk
 from tkinter import ttk
 import threading
 import time
+import os
 from typing import Callable, Optional
+from data.data_manager import load_json_file
 
 class LoadingScreen:
     """Loading screen with animated spinner"""
@@ -159,9 +161,6 @@ class DataLoadingManager:
     def _load_next_step(self):
         """Load data in small steps to keep UI responsive"""
         try:
-            import os
-            import json
-            
             # Step 1: Load states data
             if not hasattr(self, '_states_loaded'):
                 if self.progress_callback:
@@ -169,8 +168,7 @@ class DataLoadingManager:
                 
                 states_path = os.path.join(self.data_manager.data_dir, "states.geojson")
                 if os.path.exists(states_path):
-                    with open(states_path, 'r', encoding='utf-8') as f:
-                        self.data_manager.states_data = json.load(f)
+                    self.data_manager.states_data = load_json_file(states_path)
                     print(f"Loaded {len(self.data_manager.states_data['features'])} states")
                 else:
                     raise FileNotFoundError(f"States data file not found: {states_path}")
@@ -187,8 +185,7 @@ class DataLoadingManager:
                 
                 counties_path = os.path.join(self.data_manager.data_dir, "counties.geojson")
                 if os.path.exists(counties_path):
-                    with open(counties_path, 'r', encoding='utf-8') as f:
-                        self.data_manager.counties_data = json.load(f)
+                    self.data_manager.counties_data = load_json_file(counties_path)
                     print(f"Loaded {len(self.data_manager.counties_data['features'])} counties")
                 else:
                     raise FileNotFoundError(f"Counties data file not found: {counties_path}")
@@ -213,8 +210,6 @@ class DataLoadingManager:
     
     def _schedule_next_step(self, callback, delay_ms):
         """Schedule next loading step without blocking the main thread"""
-        import threading
-        
         def delayed_callback():
             time.sleep(delay_ms / 1000.0)  # Convert to seconds
             callback()
@@ -12,38 +12,108 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import matplotlib.patches as mpatches
-from matplotlib.patches import Polygon
+from matplotlib.collections import PolyCollection, PathCollection, LineCollection
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D
 import numpy as np
 import threading
 from typing import Optional, Dict, List, Tuple
 
 from data.api_data_manager import APIDataManager
-from data.data_manager import REGIONS, REGION_COLORS
+from data.data_manager import REGIONS, REGION_COLORS, STATE_TO_REGION, REGION_RGBA, INSET_STATES
 from gui.chloropleth_generator import ChloroplethGenerator
 from gui.api_loading_screen import APIDataLoadingManager
+from gui.pip_numba import point_in_polygon
+
+# Optional: shapely 2.0+ provides an STRtree spatial index for click hit-testing
+try:
+    import shapely
+    from shapely import STRtree
+    from shapely.geometry import Point
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+
+# Size (rows, columns) of the region-id image used for hit-testing
+REGION_RASTER_SHAPE = (512, 1024)
+
+# Region raster value for cells on a boundary (resolved with the exact test)
+REGION_RASTER_BOUNDARY = 255
+
+# Outline colour of the selected region
+HIGHLIGHT_COLOR = '#2E86DE'
+
+# Minimum interval (ms) between hover hit-tests; only the latest mouse position is tested
+MOTION_THROTTLE_MS = 80
+
+# Shared rounded background for state labels, in points around the label centre
+# (fits a two-letter 8 pt bold abbreviation, matching the old 'round,pad=0.2' bbox)
+LABEL_BOX_PATH = mpatches.BoxStyle.Round(pad=0.2)(-6.5, -4.0, 13.0, 8.0, 8)
+
+def _compound_path(rings: List[np.ndarray]) -> Path:
+    """
+    Join closed rings of any length into one Path (MOVETO, LINETO..., CLOSEPOLY per ring)
+    
+    Args:
+        rings: List of (N, 2) vertex arrays
+        
+    Returns:
+        A single compound Path that Agg fills in one draw_path call
+    """
+    if not rings:
+        return Path(np.empty((0, 2)))
+    
+    vertices = []
+    codes = []
+    for ring in rings:
+        ring_codes = np.full(len(ring) + 1, Path.LINETO, dtype=Path.code_type)
+        ring_codes[0] = Path.MOVETO
+        ring_codes[-1] = Path.CLOSEPOLY
+        vertices.append(ring)
+        vertices.append(ring[:1])  # CLOSEPOLY vertex (ignored, but required)
+        codes.append(ring_codes)
+    
+    return Path(np.concatenate(vertices), np.concatenate(codes))
 
 class RegionalPopulationViewer:
     """Main application for the Regional Population Viewer"""
     
-    def __init__(self):
-        """Initialize the application"""
-        # Initialize main window
-        self.root = tk.Tk()
-        self.root.title("Austin Averill's Population By Region Viewer")
-        self.root.geometry("1200x800")
-        self.root.configure(bg='white')
-        
-        # Create loading screen as a frame within the main window
-        self.loading_frame = self._create_loading_frame()
+    # (text, foreground) of the instructions label while no region is selected
+    DEFAULT_INSTR = ("Click on a region in the map below to select it, then click the button to create a chloropleth map", '#666666')
+    
+    def __init__(self, data_manager: Optional[APIDataManager] = None, headless: bool = False):
+        """
+        Initialize the application
+        
+        Args:
+            data_manager: Optional pre-built data manager to use instead of a new one
+            headless: Skip creating the window and loading data (for tests)
+        """
+        self.headless = headless
+        self.root = None
+        self.loading_frame = None
+        
+        if not headless:
+            # Initialize main window
+            self.root = tk.Tk()
+            self.root.title("Austin Averill's Population By Region Viewer")
+            self.root.geometry("1200x800")
+            self.root.configure(bg='white')
+            
+            # Create loading screen as a frame within the main window
+            self.loading_frame = self._create_loading_frame()
         
         # Data manager
-        self.data_manager = APIDataManager()
+        self.data_manager = data_manager if data_manager is not None else APIDataManager()
         
         # Current state
         self.selected_region = None
         self.chloropleth_generator = None
         self.last_hovered_region = None  # Cache for hover state
-        self.last_motion_time = 0  # Throttle mouse motion events
+        self._last_motion_evt = None  # Latest motion event waiting to be processed
+        self._motion_after = None  # Pending root.after id for _process_motion
+        self._last_draw_signature = None  # Inputs that produced the current map
         
         # GUI components (will be created after loading)
         self.main_frame = None
@@ -51,16 +121,35 @@ class RegionalPopulationViewer:
         self.control_frame = None
         self.figure = None
         self.canvas = None
+        self._tk_widget = None  # Tk widget behind the canvas, cached for cursor changes
+        self._current_cursor = ""  # Cursor currently set on _tk_widget
+        self._instr_state = None  # (text, foreground) currently shown in the instructions label
         self.ax_main = None
         self.ax_alaska = None
         self.ax_hawaii = None
+        self.region_artists = {}  # Region name -> PathPatch holding its contiguous states
+        self._highlight_artists = []  # Prebuilt selection outlines on the main map and insets
+        self._region_highlights = {}  # Region name -> its hidden selection outline artists
+        self._callout_segments = []  # Connector lines queued during _draw_initial_map
+        self._callout_labels = []  # (x, y, abbreviation) queued during _draw_initial_map
+        self.hover_overlay = None  # Animated PolyCollection drawn only by blitting
+        self._map_background = None  # Saved main-axes pixels for blitting
+        self._inset_backgrounds = {}  # Inset axes -> saved pixels for blitting highlights
+        self._region_raster = None  # uint8 region-id image covering the main map extent
+        self._hit_extent = None  # (xlim, ylim) covered by the region raster
+        self._region_names = [None]  # Raster value -> region name (0 means no region)
+        self._state_tree = None  # shapely STRtree over contiguous state rings
+        self._state_polys = []  # Ring polygons indexed by _state_tree
+        self._state_names = []  # State name for each entry in _state_polys
+        self._state_rings = []  # (state, float64 ring, min_x, max_x, min_y, max_y) for ray casting
         self.create_chloro_btn = None
         
         # Loading state
         self.loading_manager = None
         
         # Start loading process
-        self._start_loading_process()
+        if not headless:
+            self._start_loading_process()
     
     def _create_loading_frame(self):
         """Create the loading screen frame"""
@@ -111,8 +200,19 @@ class RegionalPopulationViewer:
         )
         self.progress_label.pack(pady=(5, 30))
         
-        # Start spinner animation
+        # Spinner arc is created once and rotated in place by _animate_spinner
         self.spinner_angle = 0
+        self._spin_id = self.spinner_canvas.create_arc(
+            10, 10, 70, 70,
+            start=self.spinner_angle,
+            extent=60,
+            outline='#3498db',
+            width=4,
+            style='arc',
+            tags="spinner"
+        )
+        
+        # Start spinner animation
         self.is_loading = True
         self._animate_spinner()
         
@@ -122,29 +222,19 @@ class RegionalPopulationViewer:
         """Animate the loading spinner - runs independently of data loading"""
         if self.is_loading:
             try:
-                self.spinner_canvas.delete("spinner")
-                
-                # Draw spinner arc
-                self.spinner_canvas.create_arc(
-                    10, 10, 70, 70,
-                    start=self.spinner_angle,
-                    extent=60,
-                    outline='#3498db',
-                    width=4,
-                    style='arc',
-                    tags="spinner"
-                )
+                # Rotate the existing arc rather than recreating it every frame
+                self.spinner_canvas.itemconfig(self._spin_id, start=self.spinner_angle)
                 
                 # Update angle for animation
-                self.spinner_angle = (self.spinner_angle + 12) % 360
+                self.spinner_angle = (self.spinner_angle + 30) % 360
                 
             except tk.TclError:
                 # Handle case where canvas is destroyed
                 self.is_loading = False
                 return
             
-            # Schedule next frame at higher frequency for smoother animation
-            self.root.after(30, self._animate_spinner)
+            # ~12 fps keeps the spinner smooth without stealing time from the loader
+            self.root.after(80, self._animate_spinner)
     
     def _start_loading_process(self):
         """Start the data loading process with progress updates"""
@@ -158,13 +248,16 @@ class RegionalPopulationViewer:
         loading_thread = threading.Thread(target=self._load_data_with_progress)
         loading_thread.daemon = True
         loading_thread.start()
-        
-        # Check loading status periodically
-        self._check_loading_status()
     
     def _load_data_with_progress(self):
         """Load data in background thread"""
         self.loading_manager.load_data_async()
+        
+        # Hand the result straight to the GUI thread instead of polling for it
+        if self.loading_manager.loading_successful:
+            self.root.after(0, self._on_loading_complete)
+        else:
+            self.root.after(0, self._on_loading_error)
     
     def _update_loading_progress(self, status: str):
         """Update loading screen with current status"""
@@ -176,17 +269,6 @@ class RegionalPopulationViewer:
         if hasattr(self, 'status_label') and self.status_label.winfo_exists():
             self.status_label.config(text=status)
     
-    def _check_loading_status(self):
-        """Check if loading is complete and handle accordingly"""
-        if self.loading_manager.loading_complete:
-            if self.loading_manager.loading_successful:
-                self._on_loading_complete()
-            else:
-                self._on_loading_error()
-        else:
-            # Check again more frequently for better responsiveness
-            self.root.after(50, self._check_loading_status)
-    
     def _on_loading_complete(self):
         """Handle successful data loading completion"""
         print("🎉 Loading complete - starting GUI setup...")
@@ -198,7 +280,7 @@ class RegionalPopulationViewer:
         self.loading_frame.destroy()
         
         # Force UI update to clear loading frame
-        self.root.update()
+        self.root.update_idletasks()
         
         # Set up main GUI (creates the main_frame)
         print("🖼️ Setting up main GUI...")
@@ -212,7 +294,7 @@ class RegionalPopulationViewer:
         self._show_rendering_overlay()
         
         # Force UI update to show the overlay
-        self.root.update()
+        self.root.update_idletasks()
         
         # Draw initial map (this will take time)
         print("🗺️ Drawing initial map...")
@@ -337,10 +419,11 @@ class RegionalPopulationViewer:
         # Instructions label (dynamic text based on selection)
         self.instructions = ttk.Label(
             self.control_frame,
-            text="Click on a region in the map below to select it, then click the button to create a chloropleth map",
+            text=self.DEFAULT_INSTR[0],
             font=('Arial', 10),
-            foreground='#666666'
+            foreground=self.DEFAULT_INSTR[1]
         )
+        self._instr_state = self.DEFAULT_INSTR
         self.instructions.grid(row=0, column=1, sticky=(tk.W, tk.E))
         
         # Map container
@@ -360,14 +443,37 @@ class RegionalPopulationViewer:
         # Alaska and Hawaii insets (will be positioned later)
         # We'll create these as separate axes positioned within the main plot
         
+        # Legend and title live on the figure, so map redraws never rebuild them
+        self._add_figure_legend_and_title()
+        
         # Create canvas
         self.canvas = FigureCanvasTkAgg(self.figure, self.map_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.canvas.draw_idle()
+        self._tk_widget = self.canvas.get_tk_widget()
+        self._current_cursor = ""
+        self._tk_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
         
         # Bind click and motion events
         self.canvas.mpl_connect('button_press_event', self._on_map_click)
         self.canvas.mpl_connect('motion_notify_event', self._on_mouse_motion)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        self.canvas.mpl_connect('resize_event', self._on_canvas_resize)
+    
+    def _add_figure_legend_and_title(self):
+        """Create the region legend and map title once as figure-level artists"""
+        region_handles = [
+            mpatches.Patch(color=REGION_RGBA[region], label=region)
+            for region in REGION_COLORS
+        ]
+        
+        # Legend sits to the right of the main map to avoid the Alaska/Hawaii insets
+        self.figure.legend(
+            handles=region_handles,
+            loc='center left',
+            bbox_to_anchor=(1.02, 0.5),
+            bbox_transform=self.ax_main.transAxes
+        )
+        self.figure.suptitle("United States by Region", fontsize=14, fontweight='bold')
     
     def _load_data(self):
         """Load GeoJSON data (called after loading screen completes)"""
@@ -387,95 +493,70 @@ class RegionalPopulationViewer:
         
         print(f"✅ Data is loaded: {len(self.data_manager.states_data['features'])} states available")
         
+        # Map extent for continental US
+        xlim = (-130, -65)
+        ylim = (20, 50)
+        
+        # Nothing to do if the map already shows exactly these inputs
+        draw_signature = (frozenset(self.data_manager.state_geoms), self.selected_region, (xlim, ylim))
+        if draw_signature == self._last_draw_signature:
+            print("✅ Map unchanged - skipping redraw")
+            return
+        
         # Clear the axes
         self.ax_main.clear()
+        self._highlight_artists = []  # Cleared along with the axes
+        self._region_highlights = {}
+        
+        # Fix the map extent up front so adding artists never triggers autoscaling
+        self.ax_main.set_xlim(*xlim)
+        self.ax_main.set_ylim(*ylim)
+        self.ax_main.set_aspect('equal')
+        self.ax_main.set_autoscale_on(False)
+        self.ax_main.axis('off')
         
-        # Track regions for legend
-        region_patches = {}
+        # Track which regions were drawn (for the summary)
+        regions_found = []
+        
+        # Positions of regular (non-callout) labels, backed by one shared box collection
+        label_positions = []
+        
+        # Callout labels are collected in the loop and drawn together afterwards
+        self._callout_segments = []
+        self._callout_labels = []
+        
+        # State rings grouped by region, each region drawn as one compound path
+        region_rings = {}
         states_drawn = 0
-        states_skipped = 0
-        total_states = len(self.data_manager.states_data['features'])
+        contiguous_features = self.data_manager.contiguous_features
+        total_states = len(contiguous_features)
+        
+        # Alaska, Hawaii and territories without a region were filtered out at load time
+        states_skipped = len(self.data_manager.states_data['features']) - total_states
         
         # Plot states with regional coloring
-        for i, feature in enumerate(self.data_manager.states_data['features']):
-            # Update progress every 10 states
-            if i % 10 == 0 and hasattr(self, 'rendering_status_label') and self.rendering_status_label:
+        for i, feature in enumerate(contiguous_features):
+            # Update progress every 25 states (flush idle tasks only, no full event pump)
+            if i % 25 == 0 and hasattr(self, 'rendering_status_label') and self.rendering_status_label:
                 progress_pct = (i / total_states) * 100
                 self.rendering_status_label.config(text=f"Drawing map features... {progress_pct:.0f}%")
-                self.root.update()
+                self.root.update_idletasks()
             
             state_name = feature['properties']['NAME']
-            region = self.data_manager.get_state_region(state_name)
+            region = STATE_TO_REGION[state_name]
             
-            if not region:
-                print(f"⚠️ No region found for state: {state_name}")
+            # Exterior rings were parsed once when the states were loaded
+            rings = self.data_manager.state_geoms.get(state_name)
+            if rings is None:
                 states_skipped += 1
-                continue
-            
-            # Skip non-contiguous states for main map
-            if state_name in ['Alaska', 'Hawaii']:
-                print(f"🏔️ Skipping non-contiguous state: {state_name}")
-                states_skipped += 1
-                continue
-            
-            # Handle different geometry types
-            geometry = feature['geometry']
-            geom_type = geometry['type']
-            
-            if geom_type == 'Polygon':
-                # Single polygon - draw it
-                coords = geometry['coordinates'][0]  # Exterior ring
-                coords_array = np.array(coords)
-                
-                polygon = Polygon(
-                    coords_array, 
-                    facecolor=self.data_manager.get_region_color(region),
-                    edgecolor='white',
-                    linewidth=1.5,
-                    alpha=0.8
-                )
-                self.ax_main.add_patch(polygon)
-                states_drawn += 1
-                print(f"✅ Drew polygon for {state_name} in {region}")
-                
-            elif geom_type == 'MultiPolygon':
-                # Multiple polygons - draw all of them
-                polygons_added = 0
-                for polygon_coords in geometry['coordinates']:
-                    coords = polygon_coords[0]  # Exterior ring of each polygon
-                    coords_array = np.array(coords)
-                    
-                    # Skip very small islands (less than 5 points) for visual clarity
-                    if len(coords_array) < 5:
-                        continue
-                    
-                    polygon = Polygon(
-                        coords_array, 
-                        facecolor=self.data_manager.get_region_color(region),
-                        edgecolor='white',
-                        linewidth=1.5,
-                        alpha=0.8
-                    )
-                    self.ax_main.add_patch(polygon)
-                    polygons_added += 1
-                    
-                states_drawn += 1
-                print(f"✅ Drew {polygons_added} polygons for {state_name} in {region}")
             else:
-                print(f"⚠️ Unknown geometry type '{geom_type}' for {state_name}")
+                region_rings.setdefault(region, []).extend(rings)
+                states_drawn += 1
             
-            # Add to legend tracking
-            if region not in region_patches:
-                region_patches[region] = mpatches.Patch(
-                    color=self.data_manager.get_region_color(region),
-                    label=region
-                )
+            if region not in regions_found:
+                regions_found.append(region)
             
             # Add state abbreviation label at centroid of the largest polygon
-            # Skip territories (not states in our dataset)
-            if state_name in ['Puerto Rico', 'U.S. Virgin Islands']:
-                continue
-                
             centroid = self._get_state_centroid(feature)
             if centroid:
                 state_abbr = feature['properties'].get('STATE_ABBR', feature['properties'].get('STUSPS', state_name[:2].upper()))
@@ -484,44 +565,77 @@ class RegionalPopulationViewer:
                 if self._needs_callout_label(state_name):
                     self._add_callout_label(state_name, state_abbr, centroid, region)
                 else:
-                    # Regular centered label
+                    # Regular centered label (background box is drawn by the collection below)
                     self.ax_main.text(
                         centroid[0], centroid[1], state_abbr,
                         ha='center', va='center',
                         fontsize=8, fontweight='bold',
-                        color='black',
-                        bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7, edgecolor='none')
+                        color='black'
                     )
+                    label_positions.append(centroid)
+        
+        # Callout connector lines and their labels
+        self._commit_callout_labels()
+        
+        # All regular label backgrounds in a single collection, sized in points
+        if label_positions:
+            self.ax_main.add_collection(PathCollection(
+                [LABEL_BOX_PATH],
+                offsets=label_positions,
+                offset_transform=self.ax_main.transData,
+                transform=Affine2D().scale(1 / 72) + self.figure.dpi_scale_trans,
+                facecolors='white',
+                edgecolors='none',
+                alpha=0.7,
+                zorder=2.5
+            ), autolim=False)
+        
+        # Draw each region's states as a single PathPatch (kept for later recoloring)
+        self.region_artists = {}
+        for region, rings in region_rings.items():
+            self.region_artists[region] = self.ax_main.add_patch(PathPatch(
+                _compound_path(rings),
+                facecolor=REGION_RGBA[region],
+                edgecolor='white',
+                linewidth=1.5,
+                alpha=0.8
+            ))
+        
+        # Hover overlay is animated so full redraws skip it; it is blitted on top
+        self.hover_overlay = PolyCollection(
+            [],
+            facecolors=(1, 1, 1, 0.25),
+            edgecolors='#2E86DE',
+            linewidths=2,
+            animated=True,
+            zorder=5
+        )
+        self.ax_main.add_collection(self.hover_overlay, autolim=False)
+        self.last_hovered_region = None
         
-        # Set map extent for continental US
-        self.ax_main.set_xlim(-130, -65)
-        self.ax_main.set_ylim(20, 50)
-        self.ax_main.set_aspect('equal')
-        self.ax_main.axis('off')
-        
-        # Add legend (moved to right side to avoid Alaska/Hawaii insets)
-        if region_patches:
-            self.ax_main.legend(
-                handles=list(region_patches.values()),
-                loc='center left',
-                bbox_to_anchor=(1.02, 0.5)
-            )
+        # Rasterize region ids once so hit-testing is usually a single array lookup
+        self._build_region_raster(xlim, ylim)
         
-        # Add title
-        self.ax_main.set_title("United States by Region", fontsize=14, fontweight='bold', pad=20)
+        # Spatial index for exact click hit-testing
+        self._build_state_index()
         
         # Add Alaska and Hawaii insets
         self._add_alaska_hawaii_insets()
         
+        # Selection outlines are built once, hidden, and only toggled afterwards
+        self._build_region_highlights()
+        
         # Add north arrow and scale bar
         self._add_map_elements()
         
         # Debug summary
         print(f"🎯 Map drawing summary: {states_drawn} states drawn, {states_skipped} states skipped")
-        print(f"📊 Regions found: {list(region_patches.keys())}")
+        print(f"📊 Regions found: {regions_found}")
         
-        self.canvas.draw()
-        print("🖼️ Canvas draw complete!")
+        # Let Tk coalesce the render into the next idle cycle
+        self.canvas.draw_idle()
+        self._last_draw_signature = draw_signature
+        print("🖼️ Canvas draw scheduled!")
     
     def _add_alaska_hawaii_insets(self):
         """Add Alaska and Hawaii as inset maps"""
@@ -541,62 +655,37 @@ class RegionalPopulationViewer:
         """Draw a state in an inset axis"""
         ax.clear()
         
-        for feature in self.data_manager.states_data['features']:
-            if feature['properties']['NAME'] == state_name:
-                region = self.data_manager.get_state_region(state_name)
-                
-                # Handle different geometry types
-                geometry = feature['geometry']
-                geom_type = geometry['type']
-                
-                if geom_type == 'Polygon':
-                    coords = geometry['coordinates'][0]  # Exterior ring
-                    coords_array = np.array(coords)
-                    
-                    polygon = Polygon(
-                        coords_array,
-                        facecolor=self.data_manager.get_region_color(region),
-                        edgecolor='white',
-                        linewidth=1,
-                        alpha=0.8
-                    )
-                    ax.add_patch(polygon)
-                    
-                elif geom_type == 'MultiPolygon':
-                    # Handle multiple islands/polygons (important for Hawaii and Alaska)
-                    for polygon_coords in geometry['coordinates']:
-                        coords = polygon_coords[0]  # Exterior ring
-                        coords_array = np.array(coords)
-                        
-                        # Skip very small islands for visual clarity
-                        if len(coords_array) < 5:
-                            continue
-                        
-                        polygon = Polygon(
-                            coords_array,
-                            facecolor=self.data_manager.get_region_color(region),
-                            edgecolor='white',
-                            linewidth=1,
-                            alpha=0.8
-                        )
-                        ax.add_patch(polygon)
-                
-                # Add state abbreviation at centroid of largest polygon
-                centroid = self._get_state_centroid(feature)
-                if centroid:
-                    state_abbr = feature['properties'].get('STATE_ABBR', feature['properties'].get('STUSPS', state_name[:2].upper()))
-                    ax.text(
-                        centroid[0], centroid[1], state_abbr,
-                        ha='center', va='center',
-                        fontsize=8, fontweight='bold',
-                        color='black',
-                        bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8, edgecolor='none')
-                    )
-                break
-        
+        # Fix the inset extent before adding artists (no autoscaling)
         ax.set_xlim(xlim)
         ax.set_ylim(ylim)
         ax.set_aspect('equal')
+        ax.set_autoscale_on(False)
+        
+        feature = self.data_manager.inset_features.get(state_name)
+        if feature:
+            region = STATE_TO_REGION.get(state_name)
+            state_rings = self.data_manager.state_geoms.get(state_name, [])
+            
+            ax.add_patch(PathPatch(
+                _compound_path(state_rings),
+                facecolor=REGION_RGBA[region],
+                edgecolor='white',
+                linewidth=1,
+                alpha=0.8
+            ))
+            
+            # Add state abbreviation at centroid of largest polygon
+            centroid = self._get_state_centroid(feature)
+            if centroid:
+                state_abbr = feature['properties'].get('STATE_ABBR', feature['properties'].get('STUSPS', state_name[:2].upper()))
+                ax.text(
+                    centroid[0], centroid[1], state_abbr,
+                    ha='center', va='center',
+                    fontsize=8, fontweight='bold',
+                    color='black',
+                    bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8, edgecolor='none')
+                )
+        
         ax.set_title(state_name, fontsize=10)
         
         # Remove tick marks and labels for cleaner appearance
@@ -631,80 +720,9 @@ class RegionalPopulationViewer:
             bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8)
         )
     
-    def _calculate_polygon_centroid(self, coords: np.ndarray) -> Optional[Tuple[float, float]]:
-        """Calculate a better centroid of a polygon using area-weighted method"""
-        try:
-            if len(coords) < 3:
-                return None
-            
-            # Calculate area-weighted centroid (more accurate for irregular shapes)
-            x = coords[:, 0]
-            y = coords[:, 1]
-            
-            # Close the polygon if not already closed
-            if not (x[0] == x[-1] and y[0] == y[-1]):
-                x = np.append(x, x[0])
-                y = np.append(y, y[0])
-            
-            # Calculate area and centroid using the shoelace formula
-            area = 0.0
-            cx = 0.0
-            cy = 0.0
-            
-            for i in range(len(x) - 1):
-                cross = x[i] * y[i + 1] - x[i + 1] * y[i]
-                area += cross
-                cx += (x[i] + x[i + 1]) * cross
-                cy += (y[i] + y[i + 1]) * cross
-            
-            area = area / 2.0
-            if abs(area) < 1e-10:  # Avoid division by zero
-                # Fallback to simple mean if area calculation fails
-                return (np.mean(coords[:, 0]), np.mean(coords[:, 1]))
-            
-            cx = cx / (6.0 * area)
-            cy = cy / (6.0 * area)
-            
-            return (cx, cy)
-        except:
-            # Fallback to simple mean if calculation fails
-            try:
-                return (np.mean(coords[:, 0]), np.mean(coords[:, 1]))
-            except:
-                return None
-    
     def _get_state_centroid(self, feature) -> Optional[Tuple[float, float]]:
         """Get the centroid of the largest polygon for a state (for label placement)"""
-        geometry = feature['geometry']
-        geom_type = geometry['type']
-        
-        if geom_type == 'Polygon':
-            coords = np.array(geometry['coordinates'][0])
-            return self._calculate_polygon_centroid(coords)
-            
-        elif geom_type == 'MultiPolygon':
-            # Find the largest polygon by area (more accurate than just point count)
-            largest_polygon = None
-            max_area = 0
-            
-            for polygon_coords in geometry['coordinates']:
-                coords = np.array(polygon_coords[0])  # Exterior ring
-                if len(coords) < 3:
-                    continue
-                    
-                # Calculate approximate area using shoelace formula
-                x = coords[:, 0]
-                y = coords[:, 1]
-                area = 0.5 * abs(sum(x[i] * y[i + 1] - x[i + 1] * y[i] for i in range(-1, len(x) - 1)))
-                
-                if area > max_area:
-                    max_area = area
-                    largest_polygon = coords
-            
-            if largest_polygon is not None:
-                return self._calculate_polygon_centroid(largest_polygon)
-        
-        return None
+        return self.data_manager.state_centroids.get(feature['properties']['NAME'])
     
     def _needs_callout_label(self, state_name: str) -> bool:
         """Check if a state needs a callout label due to crowded positioning"""
@@ -733,28 +751,36 @@ class RegionalPopulationViewer:
             # Get the callout position
             callout_x, callout_y = callout_positions[state_name]
             
-            # Draw the callout label
+            # Queue the label and its connector line for _commit_callout_labels
+            self._callout_labels.append((callout_x, callout_y, state_abbr))
+            self._callout_segments.append([centroid, (callout_x, callout_y)])
+        else:
+            # Fallback to regular label if not in callout list
             self.ax_main.text(
-                callout_x, callout_y, state_abbr,
+                centroid[0], centroid[1], state_abbr,
                 ha='center', va='center',
                 fontsize=8, fontweight='bold',
                 color='black',
-                bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.9, edgecolor='gray')
-            )
-            
-            # Draw the callout line
-            self.ax_main.annotate(
-                '', xy=centroid, xytext=(callout_x, callout_y),
-                arrowprops=dict(arrowstyle='-', color='gray', alpha=0.7, linewidth=1)
+                bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7, edgecolor='none')
             )
-        else:
-            # Fallback to regular label if not in callout list
+    
+    def _commit_callout_labels(self):
+        """Draw all queued callout lines as one LineCollection, then their labels"""
+        if self._callout_segments:
+            self.ax_main.add_collection(LineCollection(
+                self._callout_segments,
+                colors='gray',
+                linewidths=1,
+                alpha=0.7
+            ), autolim=False)
+        
+        for callout_x, callout_y, state_abbr in self._callout_labels:
             self.ax_main.text(
-                centroid[0], centroid[1], state_abbr,
+                callout_x, callout_y, state_abbr,
                 ha='center', va='center',
                 fontsize=8, fontweight='bold',
                 color='black',
-                bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7, edgecolor='none')
+                bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.9, edgecolor='gray')
             )
     
     def _on_map_click(self, event):
@@ -779,36 +805,38 @@ class RegionalPopulationViewer:
             self._highlight_selected_region(clicked_region)
     
     def _on_mouse_motion(self, event):
-        """Handle mouse motion to provide visual feedback (throttled for performance)"""
-        import time
+        """Throttle mouse motion; hover feedback runs at most once per MOTION_THROTTLE_MS on the latest position"""
+        self._last_motion_evt = event
         
-        # Throttle mouse motion events - only process every 100ms
-        current_time = time.time()
-        if current_time - self.last_motion_time < 0.1:
+        # One pending callback at a time, so moves between hit-tests cost no Tcl calls
+        if self._motion_after is None:
+            self._motion_after = self.root.after(MOTION_THROTTLE_MS, self._process_motion)
+    
+    def _process_motion(self):
+        """Handle the most recent mouse motion to provide visual feedback"""
+        self._motion_after = None
+        event = self._last_motion_evt
+        self._last_motion_evt = None
+        if event is None:
             return
-        self.last_motion_time = current_time
         
         if event.inaxes != self.ax_main:
             # Reset cursor when outside main axis
             if self.last_hovered_region is not None:
-                self.canvas.get_tk_widget().config(cursor="")
+                self._set_cursor("")
                 self.last_hovered_region = None
+                self._set_hover_overlay(None)
                 if not self.selected_region:
-                    self.instructions.config(
-                        text="Click on a region in the map below to select it, then click the button to create a chloropleth map",
-                        foreground='#666666'
-                    )
+                    self._set_instr(*self.DEFAULT_INSTR)
             return
         
         if event.xdata is None or event.ydata is None:
             if self.last_hovered_region is not None:
-                self.canvas.get_tk_widget().config(cursor="")
+                self._set_cursor("")
                 self.last_hovered_region = None
+                self._set_hover_overlay(None)
                 if not self.selected_region:
-                    self.instructions.config(
-                        text="Click on a region in the map below to select it, then click the button to create a chloropleth map",
-                        foreground='#666666'
-                    )
+                    self._set_instr(*self.DEFAULT_INSTR)
             return
         
         # Check if mouse is over a clickable region
@@ -817,229 +845,269 @@ class RegionalPopulationViewer:
         # Only update if the hovered region has changed
         if hovered_region != self.last_hovered_region:
             self.last_hovered_region = hovered_region
+            self._set_hover_overlay(hovered_region)
             
             if hovered_region:
                 # Change cursor to indicate clickable area
-                self.canvas.get_tk_widget().config(cursor="hand2")
+                self._set_cursor("hand2")
                 
                 # Update instruction text to show what would be selected
                 if not self.selected_region:  # Only update if no region is selected
-                    self.instructions.config(
-                        text=f"Click to select: {hovered_region}",
-                        foreground='#1976D2'  # Blue color for hover state
+                    self._set_instr(
+                        f"Click to select: {hovered_region}",
+                        '#1976D2'  # Blue color for hover state
                     )
             else:
                 # Reset cursor and text when not over a clickable area
-                self.canvas.get_tk_widget().config(cursor="")
+                self._set_cursor("")
                 if not self.selected_region:  # Only reset if no region is selected
-                    self.instructions.config(
-                        text="Click on a region in the map below to select it, then click the button to create a chloropleth map",
-                        foreground='#666666'
-                    )
+                    self._set_instr(*self.DEFAULT_INSTR)
+    
+    def _set_cursor(self, cursor: str):
+        """Change the map cursor, skipping the Tk call when it is already set"""
+        if cursor != self._current_cursor:
+            self._tk_widget.config(cursor=cursor)
+            self._current_cursor = cursor
+    
+    def _set_instr(self, text: str, foreground: str):
+        """Update the instructions label, skipping the Tk call when nothing changed"""
+        if self._instr_state != (text, foreground):
+            self.instructions.config(text=text, foreground=foreground)
+            self._instr_state = (text, foreground)
+    
+    def _on_canvas_draw(self, event):
+        """Save the freshly rendered main axes as the blitting background"""
+        if self.ax_main is None:
+            return
+        self._map_background = self.canvas.copy_from_bbox(self.ax_main.bbox)
+        self._inset_backgrounds = {
+            ax: self.canvas.copy_from_bbox(ax.bbox)
+            for ax in (self.ax_alaska, self.ax_hawaii) if ax is not None
+        }
+        self._blit_overlays()
+        self._blit_inset_highlights()
+    
+    def _on_canvas_resize(self, event):
+        """Drop the saved backgrounds; the redraw after a resize captures new ones"""
+        self._map_background = None
+        self._inset_backgrounds = {}
+    
+    def _blit_overlays(self):
+        """Redraw the animated overlays on top of the saved background"""
+        if self._map_background is None:
+            return
+        self.canvas.restore_region(self._map_background)
+        for artist in self._highlight_artists:
+            if artist.axes is self.ax_main:
+                self.ax_main.draw_artist(artist)
+        if self.hover_overlay is not None:
+            self.ax_main.draw_artist(self.hover_overlay)
+        self.canvas.blit(self.ax_main.bbox)
+    
+    def _blit_inset_highlights(self):
+        """Redraw the animated highlight lines of each inset on top of its saved background"""
+        for ax, background in self._inset_backgrounds.items():
+            self.canvas.restore_region(background)
+            for artist in self._highlight_artists:
+                if artist.axes is ax:
+                    ax.draw_artist(artist)
+            self.canvas.blit(ax.bbox)
+    
+    def _set_hover_overlay(self, region: Optional[str]):
+        """Outline the hovered region using the blitted overlay"""
+        if self.hover_overlay is None:
+            return
+        
+        verts = []
+        if region:
+            for state_name in self.data_manager.get_states_in_region(region):
+                # Alaska and Hawaii live in the insets, not on the main axes
+                if state_name in INSET_STATES:
+                    continue
+                verts.extend(self.data_manager.state_geoms.get(state_name, []))
+        
+        self.hover_overlay.set_verts(verts)
+        self.hover_overlay.set_visible(bool(verts))
+        self._blit_overlays()
     
     def _update_instruction_text(self, region_name: str):
         """Update the instruction text to reflect the selected region"""
-        self.instructions.config(
-            text=f"✓ Selected region: {region_name} - Click 'Create Chloropleth Map' to visualize county-level data",
-            foreground='#2E7D32'  # Green color to indicate success
+        self._set_instr(
+            f"✓ Selected region: {region_name} - Click 'Create Chloropleth Map' to visualize county-level data",
+            '#2E7D32'  # Green color to indicate success
         )
     
+    def _build_region_highlights(self):
+        """Create one hidden outline collection per region (plus one per inset state) for selection"""
+        simple_rings = self.data_manager.state_simple_rings
+        inset_axes = {'Alaska': self.ax_alaska, 'Hawaii': self.ax_hawaii}
+        self._highlight_artists = []
+        self._region_highlights = {}
+        
+        for region, states in REGIONS.items():
+            # Contiguous states, using the simplified outlines when they were built
+            segments = []
+            for state_name in states:
+                if state_name not in INSET_STATES:
+                    segments.extend(simple_rings.get(state_name) or self.data_manager.state_geoms.get(state_name, []))
+            
+            artists = [(self.ax_main, segments, 4)]
+            
+            # Alaska and Hawaii are outlined in their own insets
+            for state_name in INSET_STATES & states:
+                if inset_axes.get(state_name) is not None:
+                    artists.append((inset_axes[state_name], self.data_manager.state_geoms.get(state_name, []), 3))
+            
+            self._region_highlights[region] = []
+            for ax, segments, linewidth in artists:
+                artist = ax.add_collection(LineCollection(
+                    segments,
+                    colors=HIGHLIGHT_COLOR,
+                    linewidths=linewidth,
+                    alpha=0.8,
+                    zorder=10,
+                    visible=False,
+                    animated=True  # Drawn only by blitting, never part of the saved background
+                ), autolim=False)
+                self._region_highlights[region].append(artist)
+                self._highlight_artists.append(artist)
+    
     def _highlight_selected_region(self, region_name: str):
         """Add a visual highlight around the selected region"""
-        # Clear any existing highlights
-        self._clear_region_highlights()
+        # Only the selected region's prebuilt outlines are shown
+        for region, artists in self._region_highlights.items():
+            for artist in artists:
+                artist.set_visible(region == region_name)
         
-        # Draw highlight border around all states in the selected region
-        states_in_region = self.data_manager.get_states_in_region(region_name)
+        self._refresh_highlights()
+    
+    def _clear_region_highlights(self):
+        """Clear any existing region highlights from main map and insets"""
+        for artist in self._highlight_artists:
+            artist.set_visible(False)
+    
+    def _refresh_highlights(self):
+        """Paint the highlights over the saved backgrounds instead of re-rendering the map"""
+        if self._map_background is None:
+            self.canvas.draw_idle()  # The draw_event handler blits the highlight
+        else:
+            self._blit_overlays()
+            self._blit_inset_highlights()
+    
+    def _build_region_raster(self, xlim: Tuple[float, float], ylim: Tuple[float, float]):
+        """Rasterize region ids over the map extent, marking boundary cells for exact testing"""
+        rows, cols = REGION_RASTER_SHAPE
+        cell_w = (xlim[1] - xlim[0]) / cols
+        cell_h = (ylim[1] - ylim[0]) / rows
+        
+        # Data coordinates of each raster cell centre
+        xs = xlim[0] + (np.arange(cols) + 0.5) * cell_w
+        ys = ylim[0] + (np.arange(rows) + 0.5) * cell_h
         
-        # Highlight color - blue
-        highlight_color = '#2E86DE'  # Blue color for highlights
+        raster = np.zeros((rows, cols), dtype=np.uint8)
+        region_names = [None] + list(REGION_COLORS)
+        region_ids = {region: i for i, region in enumerate(region_names) if region}
         
-        for feature in self.data_manager.states_data['features']:
+        for feature in self.data_manager.contiguous_features:
             state_name = feature['properties']['NAME']
+            region_id = region_ids[STATE_TO_REGION[state_name]]
             
-            # Skip Alaska and Hawaii for main map (they'll be highlighted in insets)
-            if state_name in ['Alaska', 'Hawaii']:
-                continue
-                
-            if state_name in states_in_region:
-                # Draw highlight border
-                geometry = feature['geometry']
-                geom_type = geometry['type']
+            for ring in self.data_manager.state_geoms.get(state_name, []):
+                # Only test the cells inside this ring's bounding box
+                c0 = max(int((ring[:, 0].min() - xlim[0]) / cell_w), 0)
+                c1 = min(int((ring[:, 0].max() - xlim[0]) / cell_w) + 1, cols)
+                r0 = max(int((ring[:, 1].min() - ylim[0]) / cell_h), 0)
+                r1 = min(int((ring[:, 1].max() - ylim[0]) / cell_h) + 1, rows)
+                if c0 >= c1 or r0 >= r1:
+                    continue
                 
-                if geom_type == 'Polygon':
-                    coords = geometry['coordinates'][0]
-                    coords_array = np.array(coords)
-                    
-                    # Draw thick border for highlight
-                    self.ax_main.plot(
-                        coords_array[:, 0], coords_array[:, 1], 
-                        color=highlight_color, linewidth=4, alpha=0.8, 
-                        zorder=10, label='_highlight_'
-                    )
-                    
-                elif geom_type == 'MultiPolygon':
-                    for polygon_coords in geometry['coordinates']:
-                        coords = polygon_coords[0]
-                        coords_array = np.array(coords)
-                        
-                        if len(coords_array) >= 5:  # Skip very small islands
-                            self.ax_main.plot(
-                                coords_array[:, 0], coords_array[:, 1], 
-                                color=highlight_color, linewidth=4, alpha=0.8, 
-                                zorder=10, label='_highlight_'
-                            )
-        
-        # Highlight Alaska and Hawaii insets if they're in the selected region
-        if 'Alaska' in states_in_region or 'Hawaii' in states_in_region:
-            self._highlight_insets(states_in_region, highlight_color)
-        
-        # Refresh the canvas
-        self.canvas.draw()
+                grid_x, grid_y = np.meshgrid(xs[c0:c1], ys[r0:r1])
+                inside = Path(ring).contains_points(np.column_stack((grid_x.ravel(), grid_y.ravel())))
+                raster[r0:r1, c0:c1][inside.reshape(r1 - r0, c1 - c0)] = region_id
+        
+        # Cells next to a different value may be split by a border, so defer those to the exact test
+        boundary = np.zeros(raster.shape, dtype=bool)
+        boundary[:-1, :] |= raster[:-1, :] != raster[1:, :]
+        boundary[1:, :] |= raster[1:, :] != raster[:-1, :]
+        boundary[:, :-1] |= raster[:, :-1] != raster[:, 1:]
+        boundary[:, 1:] |= raster[:, 1:] != raster[:, :-1]
+        raster[boundary] = REGION_RASTER_BOUNDARY
+        
+        self._region_raster = raster
+        self._hit_extent = (xlim, ylim)
+        self._region_names = region_names
     
-    def _highlight_insets(self, states_in_region: set, highlight_color: str):
-        """Highlight Alaska and/or Hawaii insets if they're in the selected region"""
-        for feature in self.data_manager.states_data['features']:
+    def _build_state_index(self):
+        """Precompute hit-testing data: flat ring list with bounding boxes, plus an STRtree if shapely is available"""
+        self._state_rings = []
+        for feature in self.data_manager.contiguous_features:
             state_name = feature['properties']['NAME']
+            geometry = feature['geometry']
             
-            if state_name not in states_in_region:
-                continue
-            
-            # Determine which inset to highlight
-            if state_name == 'Alaska' and hasattr(self, 'ax_alaska'):
-                target_ax = self.ax_alaska
-            elif state_name == 'Hawaii' and hasattr(self, 'ax_hawaii'):
-                target_ax = self.ax_hawaii
+            if state_name in self.data_manager.state_simple_rings:
+                # Simplified outlines are already free of tiny slivers
+                rings = self.data_manager.state_simple_rings[state_name]
+            elif geometry['type'] == 'Polygon':
+                rings = geometry['coordinates'][:1]  # Exterior ring
+            elif geometry['type'] == 'MultiPolygon':
+                # Only substantial polygons are used for hit-testing
+                rings = [polygon_coords[0] for polygon_coords in geometry['coordinates']
+                         if len(polygon_coords[0]) >= 100]
             else:
                 continue
             
-            # Draw highlight border on the inset
-            geometry = feature['geometry']
-            geom_type = geometry['type']
-            
-            if geom_type == 'Polygon':
-                coords = geometry['coordinates'][0]
-                coords_array = np.array(coords)
-                
-                target_ax.plot(
-                    coords_array[:, 0], coords_array[:, 1], 
-                    color=highlight_color, linewidth=3, alpha=0.8, 
-                    zorder=10, label='_highlight_'
-                )
-                
-            elif geom_type == 'MultiPolygon':
-                for polygon_coords in geometry['coordinates']:
-                    coords = polygon_coords[0]
-                    coords_array = np.array(coords)
-                    
-                    if len(coords_array) >= 5:
-                        target_ax.plot(
-                            coords_array[:, 0], coords_array[:, 1], 
-                            color=highlight_color, linewidth=3, alpha=0.8, 
-                            zorder=10, label='_highlight_'
-                        )
-    
-    def _clear_region_highlights(self):
-        """Clear any existing region highlights from main map and insets"""
-        # Clear highlights from main map
-        lines_to_remove = []
-        for line in self.ax_main.lines:
-            if hasattr(line, '_label') and line._label == '_highlight_':
-                lines_to_remove.append(line)
-        
-        for line in lines_to_remove:
-            line.remove()
-        
-        # Clear highlights from Alaska inset
-        if hasattr(self, 'ax_alaska'):
-            lines_to_remove = []
-            for line in self.ax_alaska.lines:
-                if hasattr(line, '_label') and line._label == '_highlight_':
-                    lines_to_remove.append(line)
-            
-            for line in lines_to_remove:
-                line.remove()
-        
-        # Clear highlights from Hawaii inset
-        if hasattr(self, 'ax_hawaii'):
-            lines_to_remove = []
-            for line in self.ax_hawaii.lines:
-                if hasattr(line, '_label') and line._label == '_highlight_':
-                    lines_to_remove.append(line)
-            
-            for line in lines_to_remove:
-                line.remove()
-    
-    def _find_clicked_region(self, x: float, y: float) -> Optional[str]:
-        """Find which region contains the clicked point using proper point-in-polygon testing"""
+            for ring in rings:
+                if len(ring) < 4:  # A closed ring needs at least 4 coordinates
+                    continue
+                coords = np.ascontiguousarray(ring, dtype=np.float64)
+                min_x, min_y = coords.min(axis=0)
+                max_x, max_y = coords.max(axis=0)
+                self._state_rings.append((state_name, coords, min_x, max_x, min_y, max_y))
         
-        # Check each state to see if the click point is inside it
-        for feature in self.data_manager.states_data['features']:
-            state_name = feature['properties']['NAME']
-            
-            # Skip non-contiguous states for main map
-            if state_name in ['Alaska', 'Hawaii']:
-                continue
-                
-            region = self.data_manager.get_state_region(state_name)
-            if not region:
-                continue
-            
-            # Check if point is inside this state's geometry
-            if self._point_in_state(x, y, feature):
-                return region
+        if not SHAPELY_AVAILABLE or not self._state_rings:
+            return
         
-        return None
-    
-    def _point_in_state(self, x: float, y: float, feature) -> bool:
-        """Check if a point is inside a state's geometry using ray casting algorithm (optimized)"""
-        geometry = feature['geometry']
-        geom_type = geometry['type']
+        # Build every ring's polygon in one vectorized call from the flat coordinate array
+        ring_coords = [entry[1] for entry in self._state_rings]
+        ring_index = np.repeat(np.arange(len(ring_coords)), [len(coords) for coords in ring_coords])
+        self._state_polys = shapely.polygons(shapely.linearrings(np.concatenate(ring_coords), indices=ring_index))
+        self._state_names = [entry[0] for entry in self._state_rings]
         
-        if geom_type == 'Polygon':
-            return self._point_in_polygon(x, y, np.array(geometry['coordinates'][0]))
-            
-        elif geom_type == 'MultiPolygon':
-            # Check if point is in any of the polygons (limit to major polygons for performance)
-            for i, polygon_coords in enumerate(geometry['coordinates']):
-                coords = np.array(polygon_coords[0])  # Exterior ring
-                # Skip very small islands for hover detection (performance optimization)
-                if len(coords) >= 100:  # Only check substantial polygons
-                    if self._point_in_polygon(x, y, coords):
-                        return True
-        
-        return False
+        self._state_tree = STRtree(self._state_polys)
     
-    def _point_in_polygon(self, x: float, y: float, polygon_coords: np.ndarray) -> bool:
-        """Ray casting algorithm to determine if point is inside polygon (with bounding box optimization)"""
-        if len(polygon_coords) < 3:
-            return False
-        
-        # Quick bounding box check first (much faster than full polygon test)
-        min_x, min_y = polygon_coords[:, 0].min(), polygon_coords[:, 1].min()
-        max_x, max_y = polygon_coords[:, 0].max(), polygon_coords[:, 1].max()
-        
-        if x < min_x or x > max_x or y < min_y or y > max_y:
-            return False
+    def _find_clicked_region(self, x: float, y: float) -> Optional[str]:
+        """Find which region contains the point: raster lookup, exact test near boundaries"""
+        if self._region_raster is not None:
+            (x0, x1), (y0, y1) = self._hit_extent
+            rows, cols = self._region_raster.shape
+            col = int((x - x0) / (x1 - x0) * cols)
+            row = int((y - y0) / (y1 - y0) * rows)
+            
+            if 0 <= row < rows and 0 <= col < cols:
+                region_id = self._region_raster[row, col]
+                if region_id != REGION_RASTER_BOUNDARY:
+                    return self._region_names[region_id]
         
-        # Now do the full ray casting algorithm
-        n = len(polygon_coords)
-        inside = False
+        return self._find_region_exact(x, y)
+    
+    def _find_region_exact(self, x: float, y: float) -> Optional[str]:
+        """Find which region contains the point using proper point-in-polygon testing"""
+        if self._state_tree is not None:
+            # Only the states whose bounding boxes contain the point need an exact test
+            point = Point(x, y)
+            for idx in self._state_tree.query(point):
+                if self._state_polys[idx].contains(point):
+                    return STATE_TO_REGION.get(self._state_names[idx])
+            return None
+        
+        # Fallback without shapely: ray cast the precomputed rings, skipping by bounding box
+        for state_name, coords, min_x, max_x, min_y, max_y in self._state_rings:
+            if x < min_x or x > max_x or y < min_y or y > max_y:
+                continue
+            if point_in_polygon(x, y, coords):
+                return STATE_TO_REGION.get(state_name)
         
-        p1x, p1y = polygon_coords[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon_coords[i % n]
-            
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-        
-        return inside
+        return None
     
     def _open_chloropleth_generator(self):
         """Open the chloropleth generator for the selected region"""
@@ -1048,15 +1116,14 @@ class RegionalPopulationViewer:
         
         # Show loading indicator
         self.create_chloro_btn.config(state='disabled', text='Loading counties...')
-        self.instructions.config(
-            text=f"Loading county data for {self.selected_region} region, please wait...",
-            foreground='#FF6B35'  # Orange for loading
+        self._set_instr(
+            f"Loading county data for {self.selected_region} region, please wait...",
+            '#FF6B35'  # Orange for loading
         )
-        self.root.update()  # Force UI update
+        self.root.update_idletasks()  # Force UI update
         
         # Load counties for the selected region in a thread
         # The data manager will cache counties by region automatically
-        import threading
         def load_and_open():
             success = self.data_manager.load_counties_for_region(
                 self.selected_region,
@@ -1072,7 +1139,7 @@ class RegionalPopulationViewer:
     
     def _update_county_loading_progress(self, status: str):
         """Update UI with county loading progress"""
-        self.root.after(0, lambda: self.instructions.config(text=status))
+        self.root.after(0, lambda: self._set_instr(status, '#FF6B35'))
     
     def _on_counties_loaded(self, success: bool):
         """Handle completion of county data loading"""
@@ -1081,9 +1148,9 @@ class RegionalPopulationViewer:
         else:
             # Show error message
             self.create_chloro_btn.config(state='normal', text='🗺️ Create Chloropleth Map')
-            self.instructions.config(
-                text=f"❌ Failed to load county data for {self.selected_region}. Please try again.",
-                foreground='#D32F2F'  # Red for error
+            self._set_instr(
+                f"❌ Failed to load county data for {self.selected_region}. Please try again.",
+                '#D32F2F'  # Red for error
             )
     
     def _launch_chloropleth_generator(self):
@@ -1109,14 +1176,11 @@ class RegionalPopulationViewer:
         self.create_chloro_btn.config(state='disabled')
         
         # Reset instruction text
-        self.instructions.config(
-            text="Click on a region in the map below to select it, then click the button to create a chloropleth map",
-            foreground='#666666'
-        )
+        self._set_instr(*self.DEFAULT_INSTR)
         
-        # Clear any highlights
+        # Clear any highlights (blitted over the saved map, like every other selection change)
         self._clear_region_highlights()
-        self.canvas.draw()
+        self._refresh_highlights()
         
         if self.chloropleth_generator:
             self.chloropleth_generator.destroy()
@@ -1124,10 +1188,12 @@ class RegionalPopulationViewer:
     
     def run(self):
         """Start the application"""
-        self.root.mainloop()
+        if self.root:
+            self.root.mainloop()
     
     def destroy(self):
         """Clean up and destroy the application"""
         if self.chloropleth_generator:
             self.chloropleth_generator.destroy()
-        self.root.destroy()
\ No newline at end of file
+        if self.root:
+            self.root.destroy()
\ No newline at end of file
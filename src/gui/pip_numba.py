@@ -0,0 +1,57 @@
+"""
+Point-in-Polygon Test for Map Hit-Testing
+
+This module provides the ray-casting test used when clicking or hovering on
+the regional map. The loop is compiled with Numba when it is installed;
+otherwise an equivalent vectorized NumPy implementation is used.
+"""
+
+import numpy as np
+
+# Optional: Numba compiles the ray-casting loop to native code
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _point_in_polygon_numpy(x: float, y: float, coords: np.ndarray) -> bool:
+    """
+    Vectorized ray casting: count edges crossed by a ray running right from the point
+    
+    Args:
+        x: Point x coordinate (longitude)
+        y: Point y coordinate (latitude)
+        coords: (N, 2) array of ring vertices
+        
+    Returns:
+        True if the point is inside the ring
+    """
+    p1x, p1y = coords[:, 0], coords[:, 1]
+    p2 = np.roll(coords, -1, axis=0)
+    p2x, p2y = p2[:, 0], p2[:, 1]
+    
+    straddles = (p1y > y) != (p2y > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Horizontal edges divide by zero here, but they never straddle y
+        x_cross = (p2x - p1x) * (y - p1y) / (p2y - p1y) + p1x
+    crossings = straddles & (x < x_cross)
+    
+    return bool(crossings.sum() & 1)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def point_in_polygon(x, y, coords):
+        """Ray casting over a contiguous float64 (N, 2) ring, compiled with Numba"""
+        n = coords.shape[0]
+        inside = False
+        j = n - 1
+        for i in range(n):
+            xi, yi = coords[i, 0], coords[i, 1]
+            xj, yj = coords[j, 0], coords[j, 1]
+            if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
+                inside = not inside
+            j = i
+        return inside
+else:
+    point_in_polygon = _point_in_polygon_numpy
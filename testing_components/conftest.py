@@ -0,0 +1,68 @@
+"""
+Shared pytest fixtures for the API test scripts
+
+Loading the states layer means a network fetch plus a full GeoJSON decode,
+so it is done once per test session and handed to every test.
+"""
+
+import logging
+import os
+from functools import lru_cache
+from typing import Dict, Optional
+
+import pytest
+
+from data.api_data_manager import APIDataManager
+
+# Test diagnostics are logged at INFO; run with LOGLEVEL=INFO (and -s or --log-cli-level) to see them
+logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING"), format="%(message)s")
+log = logging.getLogger(__name__)
+
+@lru_cache(maxsize=None)
+def load_states() -> APIDataManager:
+    """
+    Create a data manager with the states layer loaded (once per process)
+    
+    Returns:
+        APIDataManager with states_data populated
+    
+    Raises:
+        RuntimeError: If the states could not be loaded
+    """
+    log.info("📥 Loading states data...")
+    data_manager = APIDataManager()
+    if not data_manager.load_states_data():
+        raise RuntimeError("Failed to load states data")
+    
+    log.info("✅ States data loaded successfully")
+    return data_manager
+
+@lru_cache(maxsize=None)
+def load_region(data_manager: APIDataManager, region: str) -> Optional[Dict]:
+    """
+    Load a region's counties once per process; repeated calls hit memory
+    
+    Args:
+        data_manager: Data manager with the states layer loaded
+        region: Region name
+    
+    Returns:
+        The region's counties FeatureCollection, or None if loading failed
+    """
+    log.info(f"\n📥 Loading counties for {region} region...")
+    if not data_manager.load_counties_for_region(region):
+        return None
+    return data_manager.counties_data
+
+@pytest.fixture(scope="session")
+def data_manager() -> APIDataManager:
+    """Session-wide data manager with the states layer loaded"""
+    try:
+        return load_states()
+    except RuntimeError as e:
+        pytest.skip(f"Census API unavailable: {e}")
+
+@pytest.fixture(scope="session")
+def region_loader(data_manager):
+    """Load a region's counties into the shared data manager, cached per region"""
+    return lambda region: load_region(data_manager, region)
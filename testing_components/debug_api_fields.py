@@ -3,12 +3,9 @@
 Debug script to examine the actual field names in API data
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+import asyncio
 
 from data.api_data_manager import APIDataManager
-import json
 
 def debug_api_fields():
     """Debug the actual field names in API data"""
@@ -19,9 +16,9 @@ def debug_api_fields():
     # Create data manager
     data_manager = APIDataManager()
     
-    # Load data
+    # Load states and counties together; their requests overlap
     print("📥 Loading API data...")
-    data_manager.load_data_async()
+    asyncio.run(data_manager.load_all(load_counties=True))
     
     # Check states data
     if data_manager.states_data and 'features' in data_manager.states_data:
@@ -5,13 +5,11 @@ This script tests various approaches to identify why counties aren't loading.
 """
 
 import requests
-import sys
-import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Add path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), 'geometry_query_params'))
-
-from counties_query import counties_url, total_records_parms, counties_params
+from geometry_query_params.counties_query import counties_url, total_records_parms, counties_params
+from data.api_data_manager import fetch_features
+from data.data_manager import parse_json
 
 def test_counties_api_approaches():
     """Test different approaches to loading counties data"""
@@ -19,10 +17,13 @@ def test_counties_api_approaches():
     print("🔍 Debugging Counties API")
     print("=" * 40)
     
+    # One keep-alive session for every probe, so TLS is negotiated once
+    session = requests.Session()
+    
     # Test 1: Basic connectivity
     print("\n1️⃣ Testing basic API connectivity...")
     try:
-        response = requests.get(counties_url, timeout=10)
+        response = session.get(counties_url, timeout=10)
         print(f"   Status: {response.status_code}")
         print(f"   URL accessible: ✅")
     except Exception as e:
@@ -32,9 +33,9 @@ def test_counties_api_approaches():
     # Test 2: Get total count
     print("\n2️⃣ Testing total count query...")
     try:
-        response = requests.get(counties_url, params=total_records_parms, timeout=30)
+        response = session.get(counties_url, params=total_records_parms, timeout=30)
         print(f"   Status: {response.status_code}")
-        count_data = response.json()
+        count_data = parse_json(response.content)
         print(f"   Response: {count_data}")
         
         if 'count' in count_data:
@@ -56,9 +57,9 @@ def test_counties_api_approaches():
             "f": "json"
         }
         
-        response = requests.get(counties_url, params=simple_params, timeout=30)
+        response = session.get(counties_url, params=simple_params, timeout=30)
         print(f"   Status: {response.status_code}")
-        data = response.json()
+        data = parse_json(response.content)
         
         if 'features' in data:
             print(f"   ✅ Features returned: {len(data['features'])}")
@@ -81,9 +82,7 @@ def test_counties_api_approaches():
             "f": "json"
         }
         
-        response = requests.get(counties_url, params=geom_params, timeout=60)
-        print(f"   Status: {response.status_code}")
-        data = response.json()
+        data = fetch_features(counties_url, geom_params, timeout=60, session=session)
         
         if 'features' in data:
             print(f"   ✅ Features with geometry: {len(data['features'])}")
@@ -109,32 +108,37 @@ def test_counties_api_approaches():
         "1=1"
     ]
     
-    for where_clause in test_where_clauses:
-        try:
-            test_params = {
+    # Probe every where clause concurrently; results print as they arrive
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = {
+            ex.submit(session.get, counties_url, params={
                 "where": where_clause,
                 "outFields": "OBJECTID,NAME",
                 "f": "json",
                 "resultRecordCount": 3  # Limit results
-            }
-            
-            response = requests.get(counties_url, params=test_params, timeout=30)
-            data = response.json()
-            
-            if 'features' in data and data['features']:
-                print(f"   ✅ '{where_clause}': {len(data['features'])} features")
-            else:
-                print(f"   ❌ '{where_clause}': No features")
+            }, timeout=30): where_clause
+            for where_clause in test_where_clauses
+        }
+        
+        for future in as_completed(futures):
+            where_clause = futures[future]
+            try:
+                data = parse_json(future.result().content)
                 
-        except Exception as e:
-            print(f"   ❌ '{where_clause}': Failed - {e}")
+                if 'features' in data and data['features']:
+                    print(f"   ✅ '{where_clause}': {len(data['features'])} features")
+                else:
+                    print(f"   ❌ '{where_clause}': No features")
+                    
+            except Exception as e:
+                print(f"   ❌ '{where_clause}': Failed - {e}")
     
     # Test 6: Check service info
     print("\n6️⃣ Getting service information...")
     try:
         info_url = counties_url.replace('/query', '')
-        response = requests.get(info_url, params={'f': 'json'}, timeout=30)
-        info = response.json()
+        response = session.get(info_url, params={'f': 'json'}, timeout=30)
+        info = parse_json(response.content)
         
         print(f"   Service Name: {info.get('name', 'Unknown')}")
         print(f"   Max Record Count: {info.get('maxRecordCount', 'Unknown')}")
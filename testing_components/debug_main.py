@@ -6,12 +6,8 @@ Debug version of main.py with enhanced error catching
 import tkinter as tk
 from tkinter import messagebox
 import sys
-import os
 import traceback
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
 def main():
     """Main application entry point with enhanced debugging"""
     print("🚀 Starting Austin Averill's Population By Region Viewer...")
@@ -5,125 +5,108 @@ Run this script to test the API data loading functionality
 before integrating with the main application.
 """
 
+import logging
 import sys
-import os
+from itertools import repeat
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+from data.api_data_manager import fetch_features
+from data.data_manager import REGION_COLORS, parse_json
 
-from data.api_data_manager import APIDataManager
+log = logging.getLogger(__name__)
 
-def test_api_integration():
+def test_api_integration(data_manager):
     """Test the API data loading functionality"""
     
-    print("🚀 Testing Census TIGERweb API Integration")
-    print("=" * 50)
+    log.info("🚀 Testing Census TIGERweb API Integration")
+    log.info("=" * 50)
     
-    def progress_callback(message):
-        print(f"📡 {message}")
-    
-    # Initialize API data manager
-    print("\n1️⃣ Initializing API Data Manager...")
-    api_manager = APIDataManager()
+    # The session fixture has already loaded the states once for every test
+    api_manager = data_manager
     
     # Test states data loading
-    print("\n2️⃣ Testing States Data Loading...")
-    if api_manager.load_states_data(progress_callback):
-        print(f"✅ States loaded successfully: {len(api_manager.states_data['features'])} states")
-        
-        # Show sample state
-        if api_manager.states_data['features']:
-            sample_state = api_manager.states_data['features'][0]
-            print(f"   Sample: {sample_state['properties']['NAME']}")
-    else:
-        print("❌ Failed to load states data")
-        return False
+    log.info("\n2️⃣ Testing States Data Loading...")
+    log.info(f"✅ States loaded successfully: {len(api_manager.states_data['features'])} states")
+    assert api_manager.states_data['features'], "No states loaded"
+    
+    # Show sample state
+    sample_state = api_manager.states_data['features'][0]
+    log.info(f"   Sample: {sample_state['properties']['NAME']}")
     
     # Test counties data loading (first 200 records for speed)
-    print("\n3️⃣ Testing Counties Data Loading (limited batch)...")
+    log.info("\n3️⃣ Testing Counties Data Loading (limited batch)...")
     
-    # Test the API endpoint directly first
-    try:
-        import requests
-        from geometry_query_params.counties_query import counties_url, total_records_parms, counties_params
-        
-        print(f"   🔍 Counties API URL: {counties_url}")
-        
-        # First test: Get total count
-        print("   📊 Getting total county count...")
-        count_response = requests.get(counties_url, params=total_records_parms, timeout=30)
-        print(f"   📊 Count response status: {count_response.status_code}")
-        count_data = count_response.json()
-        print(f"   📊 Count response: {count_data}")
-        
-        if 'count' in count_data:
-            total_count = count_data['count']
-            print(f"   📊 Total counties available: {total_count}")
-            
-            # Second test: Try to fetch first 10 counties with detailed debugging
-            test_params = counties_params.copy()
-            test_params['where'] = "OBJECTID <= 10"
-            test_params['returnGeometry'] = 'true'
-            test_params['geometryPrecision'] = '6'
-            
-            print(f"   🔍 Test parameters: {test_params}")
-            
-            response = requests.get(counties_url, params=test_params, timeout=60)
-            print(f"   📡 Response status: {response.status_code}")
-            print(f"   📡 Response headers: {dict(response.headers)}")
-            
-            counties_data = response.json()
-            print(f"   📡 Response keys: {list(counties_data.keys())}")
-            
-            if 'features' in counties_data:
-                features = counties_data['features']
-                print(f"   ✅ Counties test successful: {len(features)} counties loaded")
-                
-                if features:
-                    # Show first county in detail
-                    sample_county = features[0]
-                    print(f"   📋 Sample county structure:")
-                    print(f"       Attributes keys: {list(sample_county.get('attributes', {}).keys())}")
-                    attrs = sample_county.get('attributes', {})
-                    print(f"       Name: {attrs.get('NAME', 'N/A')}")
-                    print(f"       State: {attrs.get('STATE', 'N/A')}")
-                    print(f"       Pop100: {attrs.get('POP100', 'N/A')}")
-                    print(f"       Has geometry: {'geometry' in sample_county}")
-                else:
-                    print("   ⚠️ No features in response")
-            else:
-                print(f"   ❌ No 'features' key in response: {counties_data}")
-        else:
-            print(f"   ❌ No 'count' in response: {count_data}")
-            
-    except Exception as e:
-        print(f"❌ Counties test failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Test the API endpoint directly first; any request error fails the test
+    from geometry_query_params.counties_query import counties_url, total_records_parms, counties_params
+    
+    log.info(f"   🔍 Counties API URL: {counties_url}")
+    
+    # Reuse the manager's keep-alive session for both probes
+    session = api_manager.session
+    
+    # First test: Get total count
+    log.info("   📊 Getting total county count...")
+    count_response = session.get(counties_url, params=total_records_parms, timeout=30)
+    log.info(f"   📊 Count response status: {count_response.status_code}")
+    count_data = parse_json(count_response.content)
+    log.info(f"   📊 Count response: {count_data}")
+    
+    assert 'count' in count_data, f"No 'count' in response: {count_data}"
+    total_count = count_data['count']
+    log.info(f"   📊 Total counties available: {total_count}")
+    assert total_count > 0
+    
+    # Second test: Try to fetch first 10 counties with detailed debugging
+    test_params = counties_params.copy()
+    test_params['where'] = "OBJECTID <= 10"
+    test_params['returnGeometry'] = 'true'
+    test_params['geometryPrecision'] = '6'
+    
+    log.info(f"   🔍 Test parameters: {test_params}")
+    
+    counties_data = fetch_features(counties_url, test_params, timeout=60, session=session)
+    log.info(f"   📡 Response keys: {list(counties_data.keys())}")
+    
+    assert 'features' in counties_data, f"No 'features' key in response: {counties_data}"
+    features = counties_data['features']
+    log.info(f"   ✅ Counties test successful: {len(features)} counties loaded")
+    assert features, "No features in response"
+    
+    # Show first county in detail
+    sample_county = features[0]
+    log.info(f"   📋 Sample county structure:")
+    log.info(f"       Attributes keys: {list(sample_county.get('attributes', {}).keys())}")
+    attrs = sample_county.get('attributes', {})
+    log.info(f"       Name: {attrs.get('NAME', 'N/A')}")
+    log.info(f"       State: {attrs.get('STATE', 'N/A')}")
+    log.info(f"       Pop100: {attrs.get('POP100', 'N/A')}")
+    log.info(f"       Has geometry: {'geometry' in sample_county}")
+    assert 'geometry' in sample_county
     
     # Test region mapping
-    print("\n4️⃣ Testing Region Mapping...")
+    log.info("\n4️⃣ Testing Region Mapping...")
     test_states = ['California', 'Texas', 'New York', 'Florida']
-    for state in test_states:
-        region = api_manager.get_state_region(state)
-        color = api_manager.get_region_color(region) if region else 'None'
-        print(f"   {state} → {region} ({color})")
-    
-    print("\n🎉 API Integration Test Complete!")
-    print("\n📋 Next Steps:")
-    print("   - Run the main application to test full integration")
-    print("   - The app will now load data from Census APIs instead of static files")
-    print("   - Loading may take longer due to API calls, but data will be current")
-    
-    return True
+    
+    # Two bulk dict probes instead of two method calls per state
+    regions = list(map(api_manager._state_to_region.get, test_states))
+    colors = list(map(REGION_COLORS.get, regions, repeat('None')))
+    for state, region, color in zip(test_states, regions, colors):
+        log.info(f"   {state} → {region} ({color})")
+    assert None not in regions
+    
+    log.info("\n🎉 API Integration Test Complete!")
+    log.info("\n📋 Next Steps:")
+    log.info("   - Run the main application to test full integration")
+    log.info("   - The app will now load data from Census APIs instead of static files")
+    log.info("   - Loading may take longer due to API calls, but data will be current")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     try:
-        test_api_integration()
+        from conftest import load_states
+        test_api_integration(load_states())
     except KeyboardInterrupt:
-        print("\n\n⏹️ Test interrupted by user")
+        log.info("\n\n⏹️ Test interrupted by user")
+        sys.exit(130)
     except Exception as e:
-        print(f"\n❌ Test failed with error: {str(e)}")
-        import traceback
-        traceback.print_exc()
\ No newline at end of file
+        log.exception(f"\n❌ Test failed with error: {str(e)}")
+        sys.exit(1)
\ No newline at end of file
@@ -3,76 +3,74 @@
 Test geometry conversion to see what's actually in the data
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+import logging
 
-from data.api_data_manager import APIDataManager
-import json
+from data.api_data_manager import GEOM_TYPE_NAMES
 
-def test_geometry():
+log = logging.getLogger(__name__)
+
+def test_geometry(data_manager):
     """Test the geometry data structure"""
     
-    print("🔍 Testing Geometry Data")
-    print("=" * 60)
+    log.info("🔍 Testing Geometry Data")
+    log.info("=" * 60)
     
-    # Create data manager
-    data_manager = APIDataManager()
+    assert data_manager.states_data and data_manager.states_data['features'], "No states loaded"
+    features = data_manager.states_data['features']
     
-    # Load states data
-    print("📥 Loading states data...")
-    success = data_manager.load_states_data()
+    # Look at first state
+    first_state = features[0]
     
-    if not success:
-        print("❌ Failed to load states data")
-        return
+    log.info(f"\n📊 First State: {first_state['properties']['NAME']}")
+    log.info(f"   Geometry type: {first_state['_geom_kind']}")
+    log.info(f"   Total points: {first_state['_total_points']}")
     
-    print("✅ States data loaded successfully")
+    assert first_state['_geom_kind'] in ('Polygon', 'MultiPolygon')
+    assert first_state['_geom_kind'] == first_state['geometry']['type']
+    assert first_state['_total_points'] == first_state['_ring_lens'].sum()
     
-    if data_manager.states_data and 'features' in data_manager.states_data:
-        # Look at first state
-        first_state = data_manager.states_data['features'][0]
-        
-        print(f"\n📊 First State: {first_state['properties']['NAME']}")
-        print(f"   Geometry type: {first_state['geometry']['type']}")
-        
-        # Check coordinates
-        geom = first_state['geometry']
-        if geom['type'] == 'Polygon':
-            print(f"   Number of rings: {len(geom['coordinates'])}")
-            if geom['coordinates']:
-                first_ring = geom['coordinates'][0]
-                print(f"   Points in first ring: {len(first_ring)}")
-                if first_ring:
-                    print(f"   First coordinate: {first_ring[0]}")
-                    print(f"   Coordinate format: lon={first_ring[0][0]}, lat={first_ring[0][1]}")
-        elif geom['type'] == 'MultiPolygon':
-            print(f"   Number of polygons: {len(geom['coordinates'])}")
-            if geom['coordinates']:
-                first_poly = geom['coordinates'][0]
-                print(f"   Rings in first polygon: {len(first_poly)}")
-                if first_poly:
-                    first_ring = first_poly[0]
-                    print(f"   Points in first ring: {len(first_ring)}")
-                    if first_ring:
-                        print(f"   First coordinate: {first_ring[0]}")
-                        print(f"   Coordinate format: lon={first_ring[0][0]}, lat={first_ring[0][1]}")
+    # Check coordinates
+    geom = first_state['geometry']
+    assert geom['coordinates'], "First state has no coordinates"
+    if first_state['_geom_kind'] == 'Polygon':
+        log.info(f"   Number of rings: {len(geom['coordinates'])}")
+        first_ring = geom['coordinates'][0]
+    else:
+        log.info(f"   Number of polygons: {len(geom['coordinates'])}")
+        first_poly = geom['coordinates'][0]
+        log.info(f"   Rings in first polygon: {len(first_poly)}")
+        assert first_poly, "First polygon has no rings"
+        first_ring = first_poly[0]
+    
+    log.info(f"   Points in first ring: {first_ring.shape[0]}")
+    log.info(f"   First coordinate: {first_ring[0]}")
+    log.info(f"   Coordinate format: lon={first_ring[0][0]}, lat={first_ring[0][1]}")
+    
+    # A closed (N, 2) ring in lon/lat degrees
+    assert first_ring.ndim == 2 and first_ring.shape[1] == 2
+    assert first_ring.shape[0] >= 4
+    assert (first_ring[0] == first_ring[-1]).all()
+    assert -180 <= first_ring[0][0] <= 180 and -90 <= first_ring[0][1] <= 90
+    
+    # The parallel arrays line up with the features
+    assert len(data_manager.state_names) == len(features)
+    assert len(data_manager.state_geom_types) == len(features)
+    assert data_manager.state_point_counts.tolist() == [feature['_total_points'] for feature in features]
+    
+    # Check a few states
+    log.info(f"\n📋 Sample of states and their geometry types:")
+    for i, (state_name, geom_code, coord_count) in enumerate(zip(
+        data_manager.state_names[:10],
+        data_manager.state_geom_types[:10],
+        data_manager.state_point_counts[:10]
+    )):
+        geom_type = GEOM_TYPE_NAMES.get(int(geom_code), 'Unknown')
         
-        # Check a few states
-        print(f"\n📋 Sample of states and their geometry types:")
-        for i, feature in enumerate(data_manager.states_data['features'][:10]):
-            state_name = feature['properties']['NAME']
-            geom_type = feature['geometry']['type']
-            has_coords = len(feature['geometry']['coordinates']) > 0 if 'coordinates' in feature['geometry'] else False
-            
-            if has_coords and geom_type == 'Polygon':
-                coord_count = len(feature['geometry']['coordinates'][0]) if feature['geometry']['coordinates'] else 0
-            elif has_coords and geom_type == 'MultiPolygon':
-                coord_count = sum(len(poly[0]) for poly in feature['geometry']['coordinates'] if poly)
-            else:
-                coord_count = 0
-            
-            print(f"   {i+1}. {state_name:20s} - {geom_type:12s} - {coord_count:6d} points")
+        log.info(f"   {i+1}. {state_name:20s} - {geom_type:12s} - {coord_count:6d} points")
+        assert geom_type in ('Polygon', 'MultiPolygon')
+        assert coord_count > 0
 
 if __name__ == "__main__":
-    test_geometry()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    from conftest import load_states
+    test_geometry(load_states())
@@ -3,45 +3,39 @@
 Test loading counties for a specific region
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+import logging
 
-from data.api_data_manager import APIDataManager
+log = logging.getLogger(__name__)
 
-def test_region_counties():
+def test_region_counties(data_manager, region_loader):
     """Test loading counties for a specific region"""
     
-    print("🔍 Testing Region-Specific County Loading")
-    print("=" * 60)
+    log.info("🔍 Testing Region-Specific County Loading")
+    log.info("=" * 60)
     
-    # Create data manager
-    data_manager = APIDataManager()
-    
-    # Load states data first
-    print("📥 Loading states data...")
-    if not data_manager.load_states_data():
-        print("❌ Failed to load states data")
-        return
-    
-    print("✅ States data loaded successfully")
-    
-    # Test loading counties for West region
+    # Test loading counties for West region (cached for the whole session)
     test_region = "West"
-    print(f"\n📥 Loading counties for {test_region} region...")
+    counties_data = region_loader(test_region)
+    
+    assert counties_data, f"Failed to load counties for {test_region}"
+    assert counties_data['features'], f"No counties returned for {test_region}"
+    log.info(f"\n✅ Successfully loaded counties for {test_region}")
+    log.info(f"   Total counties: {len(counties_data['features'])}")
     
-    success = data_manager.load_counties_for_region(test_region)
+    # Show sample
+    sample = counties_data['features'][0]
+    log.info(f"   Sample county: {sample['properties']['NAME']} (State: {sample['properties']['STATE']})")
     
-    if success:
-        print(f"\n✅ Successfully loaded counties for {test_region}")
-        print(f"   Total counties: {len(data_manager.counties_data['features'])}")
-        
-        # Show sample
-        if data_manager.counties_data['features']:
-            sample = data_manager.counties_data['features'][0]
-            print(f"   Sample county: {sample['properties']['NAME']} (State: {sample['properties']['STATE']})")
-    else:
-        print(f"❌ Failed to load counties for {test_region}")
+    # Every county must belong to one of the region's states
+    states_in_region = data_manager.get_states_in_region(test_region)
+    region_fips = {feature['properties']['STATE'] for feature in data_manager.states_data['features']
+                   if feature['properties']['NAME'] in states_in_region}
+    outside = [county['properties']['NAME'] for county in counties_data['features']
+               if county['properties']['STATE'] not in region_fips]
+    assert not outside, f"Counties outside {test_region}: {outside[:10]}"
 
 if __name__ == "__main__":
-    test_region_counties()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    from conftest import load_states, load_region
+    data_manager = load_states()
+    test_region_counties(data_manager, lambda region: load_region(data_manager, region))
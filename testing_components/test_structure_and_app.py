@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test the converted data structure and what the application sees
+
+All checks share the session-loaded states, so the layer is fetched once;
+the application checks get its first feature through a first_feature fixture,
+and the region mapping is parameterized per state.
+"""
+
+import logging
+from itertools import repeat
+
+import pytest
+
+from data.data_manager import REGION_COLORS, STATE_TO_REGION
+
+log = logging.getLogger(__name__)
+
+REGION_TEST_STATES = ['California', 'Texas', 'New York', 'Florida', 'Alaska']
+
+@pytest.fixture(scope="module")
+def first_feature(data_manager):
+    """First state feature of the shared data manager"""
+    if not (data_manager.states_data and data_manager.states_data.get('features')):
+        pytest.skip("No states data available")
+    return data_manager.states_data['features'][0]
+
+def test_data_structure(data_manager):
+    """Test the actual data structure after conversion"""
+    
+    log.info("🔍 Testing Data Structure After Conversion")
+    log.info("=" * 50)
+    
+    first_feature = data_manager.states_data['features'][0]
+    
+    log.info(f"\n📊 States data structure:")
+    log.info(f"   Feature structure: {list(first_feature.keys())}")
+    log.info(f"   Properties: {first_feature['properties']}")
+    
+    assert first_feature['type'] == 'Feature'
+    assert {'type', 'properties', 'geometry'} <= set(first_feature.keys())
+    assert {'NAME', 'STATE'} <= set(first_feature['properties'])
+    
+    # Test accessing the way the application does
+    state_name = first_feature['properties']['NAME']
+    state_abbr = first_feature['properties'].get('STATE_ABBR', 'N/A')
+    
+    log.info(f"   State: {state_name}, Abbr: {state_abbr}")
+    assert state_name
+    assert len(first_feature['properties']['STATE']) == 2  # Two-digit STATE FIPS
+    
+    # Test region mapping (territories such as Puerto Rico belong to no region)
+    region = data_manager.get_state_region(state_name)
+    log.info(f"   Region: {region}")
+    assert region == STATE_TO_REGION.get(state_name)
+    assert region is None or region in REGION_COLORS
+    
+    log.info(f"\n✅ Data structure is correct for application use")
+
+def test_application_data(data_manager, first_feature):
+    """Test what the application sees"""
+    
+    log.info("🧪 Testing Application Data Display")
+    log.info("=" * 50)
+    
+    log.info(f"\n🏛️ States Analysis:")
+    log.info(f"   Total states: {len(data_manager.states_data['features'])}")
+    
+    # Every state the app colors must be in the loaded layer
+    assert set(STATE_TO_REGION) <= set(data_manager.state_names.tolist())
+    
+    # Test first few states, looking up every region and color in bulk
+    state_names = data_manager.state_names[:5].tolist()
+    regions = list(map(data_manager._state_to_region.get, state_names))
+    colors = list(map(REGION_COLORS.get, regions, repeat('Unknown')))
+    for i, (state_name, region, color) in enumerate(zip(state_names, regions, colors)):
+        log.info(f"   {i+1}. {state_name} -> Region: {region}, Color: {color}")
+        if state_name in STATE_TO_REGION:
+            assert region in REGION_COLORS
+            assert color == REGION_COLORS[region]
+    
+    log.info(f"\n   Sample state feature structure:")
+    log.info(f"   Properties: {list(first_feature['properties'].keys())}")
+    log.info(f"   Geometry type: {first_feature['geometry']['type']}")
+    if first_feature['geometry']['type'] == 'Polygon':
+        log.info(f"   Coordinate points: {first_feature['_ring_lens'][0]}")
+    
+    assert first_feature['geometry']['type'] in ('Polygon', 'MultiPolygon')
+    assert first_feature['_geom_kind'] == first_feature['geometry']['type']
+    assert first_feature['_total_points'] == first_feature['_ring_lens'].sum()
+
+@pytest.mark.parametrize("state", REGION_TEST_STATES)
+def test_region_mapping(data_manager, state):
+    """Test the region and color the application uses for a state"""
+    region = data_manager.get_state_region(state)
+    color = data_manager.get_region_color(region) if region else '#CCCCCC'
+    log.info(f"   {state} -> {region} ({color})")
+    
+    assert region is not None
+    assert color == REGION_COLORS[region]
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    from conftest import load_states
+    data_manager = load_states()
+    test_data_structure(data_manager)
+    feature = data_manager.states_data['features'][0]
+    test_application_data(data_manager, feature)
+    
+    log.info(f"\n🗺️ Region Mapping Test:")
+    for state in REGION_TEST_STATES:
+        test_region_mapping(data_manager, state)